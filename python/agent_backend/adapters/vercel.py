@@ -7,9 +7,6 @@ from __future__ import annotations
 
 from typing import Any
 
-import httpx
-from mcp.client.streamable_http import streamable_http_client
-
 
 class VercelAIAdapter:
     """Adapter for creating Vercel AI SDK MCP clients from agent-backend backends.
@@ -71,6 +68,9 @@ class VercelAIAdapter:
 
         # For HTTP transports, use streamable HTTP
         if hasattr(transport, "url"):
+            import httpx
+            from mcp.client.streamable_http import streamable_http_client
+
             headers: dict[str, str] = {}
             if transport.auth_token:
                 headers["Authorization"] = f"Bearer {transport.auth_token}"
@@ -0,0 +1,63 @@
+"""Process-wide thread pool for blocking filesystem calls.
+
+Shared by every LocalFilesystemBackend (and the scopes built on them), so a
+large fan-out of backends cannot multiply the number of I/O threads.
+The size defaults to ``min(32, cpu_count * 4)`` and can be overridden with
+the ``AGENTBE_IO_THREADS`` environment variable; values that are not an
+integer are ignored with a warning.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _default_workers() -> int:
+    default = min(32, (os.cpu_count() or 1) * 4)
+    configured = os.environ.get("AGENTBE_IO_THREADS")
+    if configured:
+        try:
+            return max(1, int(configured))
+        except ValueError:
+            logger.warning(
+                "Ignoring invalid AGENTBE_IO_THREADS=%r; using %d threads", configured, default
+            )
+    return default
+
+
+def get_io_pool() -> ThreadPoolExecutor:
+    """Return the shared I/O executor, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(
+                    max_workers=_default_workers(),
+                    thread_name_prefix="agentbe-io",
+                )
+    return _pool
+
+
+async def run_io(func: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs) -> _T:
+    """Run a blocking call on the shared I/O executor."""
+    loop = asyncio.get_running_loop()
+    if kwargs:
+        return await loop.run_in_executor(get_io_pool(), functools.partial(func, *args, **kwargs))
+    return await loop.run_in_executor(get_io_pool(), func, *args)
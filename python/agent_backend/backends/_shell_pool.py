@@ -0,0 +1,219 @@
+"""Pool of long-lived shell workers for LocalFilesystemBackend.exec.
+
+Each worker is a ``bash --noprofile --norc`` process (wrapped in the backend's
+bwrap sandbox when bwrap isolation is active) that reads scripts from stdin.
+Running a command becomes a pipe write and read instead of a fresh
+fork+exec of the shell (and bwrap namespace setup) per call.
+
+Commands run in a subshell with stdin redirected from /dev/null, so changes to
+the working directory or shell variables do not leak into later commands.
+The subshell writes its stdout and stderr to a pair of FIFOs owned by the
+worker, which are read to EOF before the command completes. Like
+``communicate()`` on a one-shot process, this waits for background jobs that
+still hold the output open, so their output stays with the command that
+started them. The worker's own stdout only carries the exit status, framed
+with a random per-command sentinel.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import secrets
+import shlex
+import shutil
+import tempfile
+
+from agent_backend.backends._io_pool import run_io
+
+# StreamReader buffer limit; large enough for any command output we keep in memory.
+_STREAM_LIMIT = 1 << 30
+
+
+class ShellWorkerError(Exception):
+    """Raised when a worker exits before completing a command."""
+
+
+class _FifoReader:
+    """Reads one command's output from a FIFO until every writer has closed it.
+
+    The FIFO is opened for reading without blocking, plus a placeholder write
+    end so the reader cannot see EOF before the command has opened it. Once
+    the command has exited, ``release`` drops the placeholder and EOF arrives
+    when the last remaining writer (e.g. a background job) closes its end.
+    """
+
+    def __init__(self, path: str) -> None:
+        # Non-blocking FIFO opens return at once and never touch file data
+        read_fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        self._hold_fd: int | None = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+        self._pipe = os.fdopen(read_fd, "rb", buffering=0)
+        self._reader = asyncio.StreamReader(limit=_STREAM_LIMIT)
+        self._transport: asyncio.ReadTransport | None = None
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        protocol = asyncio.StreamReaderProtocol(self._reader)
+        self._transport, _ = await loop.connect_read_pipe(lambda: protocol, self._pipe)
+
+    def release(self) -> None:
+        if self._hold_fd is not None:
+            os.close(self._hold_fd)
+            self._hold_fd = None
+
+    async def read_all(self) -> bytes:
+        return await self._reader.read()
+
+    def close(self) -> None:
+        self.release()
+        if self._transport is not None:
+            self._transport.close()
+        else:
+            self._pipe.close()
+
+
+class _ShellWorker:
+    """A single long-lived shell process."""
+
+    def __init__(self, proc: asyncio.subprocess.Process, io_dir: str) -> None:
+        self._proc = proc
+        self._io_dir = io_dir
+        self._stdout_path = os.path.join(io_dir, "stdout")
+        self._stderr_path = os.path.join(io_dir, "stderr")
+
+    @classmethod
+    async def spawn(
+        cls, argv: list[str], env: dict[str, str], cwd: str | None, io_root: str
+    ) -> _ShellWorker:
+        io_dir = await run_io(_make_fifo_dir, io_root)
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                env=env,
+                cwd=cwd,
+                limit=_STREAM_LIMIT,
+            )
+        except BaseException:
+            await run_io(shutil.rmtree, io_dir, True)
+            raise
+        return cls(proc, io_dir)
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.returncode is None
+
+    async def run(self, command: str, cwd: str) -> tuple[bytes, bytes, int]:
+        proc = self._proc
+        assert proc.stdin is not None
+        assert proc.stdout is not None
+
+        token = f"__AGENTBE_{secrets.token_hex(16)}"
+        quoted_cwd = shlex.quote(cwd)
+        script = (
+            f"IFS= read -r -d '' __agentbe_cmd <<'{token}'\n"
+            f"{command}\n"
+            f"{token}\n"
+            f'( cd {quoted_cwd} && export HOME={quoted_cwd} && eval "$__agentbe_cmd" )'
+            f" </dev/null >{shlex.quote(self._stdout_path)} 2>{shlex.quote(self._stderr_path)}\n"
+            f"printf '{token}:%d\\n' \"$?\"\n"
+        )
+
+        out = _FifoReader(self._stdout_path)
+        err = _FifoReader(self._stderr_path)
+        try:
+            await out.start()
+            await err.start()
+            try:
+                proc.stdin.write(script.encode("utf-8"))
+                await proc.stdin.drain()
+                rc_line = await proc.stdout.readline()
+            except ConnectionError as e:
+                raise ShellWorkerError("Shell worker exited unexpectedly") from e
+            status = rc_line.removeprefix(f"{token}:".encode())
+            if status is rc_line or not status.endswith(b"\n"):
+                raise ShellWorkerError("Shell worker exited unexpectedly")
+
+            out.release()
+            err.release()
+            stdout, stderr = await asyncio.gather(out.read_all(), err.read_all())
+        finally:
+            out.close()
+            err.close()
+        return stdout, stderr, int(status)
+
+    async def kill(self) -> None:
+        if self.alive:
+            try:
+                self._proc.kill()
+            except ProcessLookupError:
+                pass
+        await self._proc.wait()
+        await run_io(shutil.rmtree, self._io_dir, True)
+
+
+class ShellPool:
+    """Bounded pool of shell workers, spawned lazily and replaced when they die."""
+
+    def __init__(
+        self,
+        argv: list[str],
+        env: dict[str, str],
+        size: int,
+        io_root: str,
+        cwd: str | None = None,
+    ) -> None:
+        """``io_root`` holds the workers' output FIFOs and is removed by ``close``.
+
+        It must be visible to the workers at the same path, so sandboxed
+        workers need it bound into the sandbox.
+        """
+        self._argv = argv
+        self._io_root = io_root
+        self._env = env
+        self._cwd = cwd
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[_ShellWorker] = []
+        self._workers: set[_ShellWorker] = set()
+
+    async def run(self, command: str, cwd: str) -> tuple[bytes, bytes, int]:
+        """Run a command on an idle worker and return (stdout, stderr, returncode)."""
+        async with self._slots:
+            worker = await self._acquire()
+            try:
+                result = await worker.run(command, cwd)
+            except BaseException:
+                # The worker may be mid-command; never hand it out again
+                self._workers.discard(worker)
+                await worker.kill()
+                raise
+            self._idle.append(worker)
+            return result
+
+    async def _acquire(self) -> _ShellWorker:
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.alive:
+                return worker
+            self._workers.discard(worker)
+        worker = await _ShellWorker.spawn(self._argv, self._env, self._cwd, self._io_root)
+        self._workers.add(worker)
+        return worker
+
+    async def close(self) -> None:
+        """Kill all workers."""
+        workers = list(self._workers)
+        self._workers.clear()
+        self._idle.clear()
+        for worker in workers:
+            await worker.kill()
+        await run_io(shutil.rmtree, self._io_root, True)
+
+
+def _make_fifo_dir(io_root: str) -> str:
+    io_dir = tempfile.mkdtemp(dir=io_root)
+    os.mkfifo(os.path.join(io_dir, "stdout"))
+    os.mkfifo(os.path.join(io_dir, "stderr"))
+    return io_dir
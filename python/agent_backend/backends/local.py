@@ -9,11 +9,19 @@ import asyncio
 import os
 import os.path
 import shutil
+import subprocess
+import tempfile
+import time
+import weakref
+from functools import cache
+from stat import S_IFDIR, S_IFMT, S_IFREG
 from typing import TYPE_CHECKING
 
+from agent_backend.backends._io_pool import run_io
+from agent_backend.backends._shell_pool import ShellPool, ShellWorkerError
 from agent_backend.backends.path_validation import (
     validate_absolute_within_root,
-    validate_within_boundary,
+    validate_within_boundary_fast,
 )
 from agent_backend.backends.status import ConnectionStatusManager
 from agent_backend.safety import is_command_safe, is_dangerous
@@ -30,11 +38,29 @@ from agent_backend.types import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Mapping
+
     from agent_backend.backends.base import Closeable
     from agent_backend.backends.scoped import ScopedFilesystemBackend
     from agent_backend.backends.status import StatusChangeCallback, Unsubscribe
     from agent_backend.types import ExecOptions, ReadOptions, ScopeConfig
 
+_BWRAP_SANDBOX_ARGS = (
+    "--unshare-all",
+    "--share-net",
+    "--die-with-parent",
+    "--dev", "/dev",
+    "--proc", "/proc",
+    "--tmpfs", "/tmp",
+    "--",
+)
+
+# ASCII characters str.strip() treats as whitespace
+_STR_WHITESPACE_ASCII = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+# Seconds a stat result may be served from the per-backend stat cache
+_STAT_CACHE_TTL = 0.05
+
 
 class LocalFilesystemBackend:
     """Local filesystem backend implementation.
@@ -45,13 +71,37 @@ class LocalFilesystemBackend:
     def __init__(self, config: LocalFilesystemBackendConfig) -> None:
         self._type = BackendType.LOCAL_FILESYSTEM
         self._root_dir = os.path.abspath(config.root_dir)
+        self._root_resolved = os.path.normpath(os.path.join("/", self._root_dir))
+        self._root_prefix = self._root_resolved + os.sep
         self._shell = config.shell
         self._isolation = config.isolation
         self._prevent_dangerous = config.prevent_dangerous
         self._on_dangerous_operation = config.on_dangerous_operation
         self._max_output_length = config.max_output_length
+        self._shell_pool_size = config.shell_pool_size
+        self._shell_pool: ShellPool | None = None
+        # Process environment snapshot, copied per exec; the last env built
+        # without per-call overrides is reused while the cwd stays the same
+        self._base_env = dict(os.environ)
+        self._last_env: tuple[str, dict[str, str]] | None = None
+        # Short-lived stat results keyed by full path: (monotonic time, stat)
+        self._stat_cache: dict[str, tuple[float, FileStat]] = {}
+        # Bumped before and after every mutation; a stat only caches its result
+        # if no mutation started or finished while it was in flight
+        self._stat_generation = 0
+        # Static part of the bwrap argv; only --chdir and the command vary per exec
+        self._bwrap_prefix = (
+            "bwrap",
+            "--ro-bind", "/usr", "/usr",
+            "--ro-bind", "/lib", "/lib",
+            "--ro-bind", "/lib64", "/lib64",
+            "--ro-bind", "/bin", "/bin",
+            "--ro-bind", "/sbin", "/sbin",
+            "--bind", self._root_dir, "/tmp/agentbe-workspace",
+        )
         self._status_manager = ConnectionStatusManager(ConnectionStatus.CONNECTED)
-        self._active_scopes: set[ScopedFilesystemBackend] = set()
+        # Weak so scopes dropped without destroy() don't pin memory
+        self._active_scopes: weakref.WeakSet[ScopedFilesystemBackend] = weakref.WeakSet()
         self._closeables: set[Closeable] = set()
 
         # Ensure root dir exists
@@ -59,6 +109,7 @@ class LocalFilesystemBackend:
 
         # Detect actual isolation method
         self._actual_isolation = self._detect_isolation()
+        self._shell_bin = self._detect_shell()
 
         if self._isolation == IsolationMode.BWRAP and self._actual_isolation != IsolationMode.BWRAP:
             raise BackendError(
@@ -88,27 +139,53 @@ class LocalFilesystemBackend:
     def _detect_isolation(self) -> IsolationMode:
         if self._isolation != IsolationMode.AUTO:
             return self._isolation
-        if shutil.which("bwrap"):
+        if _which_cached("bwrap"):
             return IsolationMode.BWRAP
         return IsolationMode.SOFTWARE
 
     def _detect_shell(self) -> str:
         if self._shell != ShellPreference.AUTO:
             return self._shell
-        if shutil.which("bash"):
+        if _which_cached("bash"):
             return "bash"
         return "sh"
 
     def _resolve_path(self, relative_path: str) -> str:
-        combined = validate_within_boundary(relative_path, self._root_dir)
-        return os.path.abspath(combined)
+        # Already normalized and rooted under the absolute root dir
+        return validate_within_boundary_fast(
+            relative_path, self._root_dir, self._root_resolved, self._root_prefix, os.path
+        )
+
+    def invalidate_stat(self, relative_path: str | None = None) -> None:
+        """Drop cached stat results for a path, or for every path if omitted.
+
+        Call after changing workspace files outside this backend.
+        """
+        full_path = None if relative_path is None else self._resolve_path(relative_path)
+        self._invalidate_stat_path(full_path)
+
+    def _invalidate_stat_path(self, full_path: str | None) -> None:
+        self._stat_generation += 1
+        if full_path is None:
+            self._stat_cache.clear()
+        else:
+            self._stat_cache.pop(full_path, None)
+
+    def _resolve_path_and_parent(self, relative_path: str) -> tuple[str, str]:
+        full_path = self._resolve_path(relative_path)
+        return full_path, os.path.dirname(full_path)
 
     def _build_env(
-        self, cwd: str, custom_env: dict[str, str] | None = None
+        self, cwd: str, custom_env: Mapping[str, str] | None = None
     ) -> dict[str, str]:
-        env = {**os.environ, "HOME": cwd}
+        if not custom_env and self._last_env is not None and self._last_env[0] == cwd:
+            return self._last_env[1]
+        env = self._base_env.copy()
+        env["HOME"] = cwd
         if custom_env:
             env.update(custom_env)
+        else:
+            self._last_env = (cwd, env)
         return env
 
     async def exec(
@@ -133,14 +210,19 @@ class LocalFilesystemBackend:
                     command,
                 )
 
-        if self._actual_isolation == IsolationMode.BWRAP:
-            return await self._exec_with_bwrap(command, options)
-        return await self._exec_direct(command, options)
+        # The command may change any file in the workspace
+        self._invalidate_stat_path(None)
+        try:
+            if self._actual_isolation == IsolationMode.BWRAP:
+                return await self._exec_with_bwrap(command, options)
+            return await self._exec_direct(command, options)
+        finally:
+            self._invalidate_stat_path(None)
 
     async def _exec_with_bwrap(
         self, command: str, options: ExecOptions | None = None
     ) -> str | bytes:
-        shell = self._detect_shell()
+        shell = self._shell_bin
         encoding = options.encoding if options else "utf8"
         requested_cwd = options.cwd if options else self._root_dir
         if not requested_cwd:
@@ -155,37 +237,49 @@ class LocalFilesystemBackend:
             else "/tmp/agentbe-workspace"
         )
 
-        env = self._build_env(bwrap_cwd, options.env if options else None)
+        custom_env = options.env if options else None
+        if self._shell_pool_size > 0 and shell == "bash" and not custom_env:
+            pool = self._get_shell_pool(
+                lambda io_root: [
+                    *self._bwrap_argv("/tmp/agentbe-workspace", "--bind", io_root, io_root),
+                    shell,
+                    "--noprofile",
+                    "--norc",
+                ],
+                self._build_env("/tmp/agentbe-workspace"),
+            )
+            return await self._run_pooled(pool, bwrap_cwd, encoding, command)
 
-        bwrap_args = [
-            "bwrap",
-            "--ro-bind", "/usr", "/usr",
-            "--ro-bind", "/lib", "/lib",
-            "--ro-bind", "/lib64", "/lib64",
-            "--ro-bind", "/bin", "/bin",
-            "--ro-bind", "/sbin", "/sbin",
-            "--bind", self._root_dir, "/tmp/agentbe-workspace",
-            "--chdir", bwrap_cwd,
-            "--unshare-all",
-            "--share-net",
-            "--die-with-parent",
-            "--dev", "/dev",
-            "--proc", "/proc",
-            "--tmpfs", "/tmp",
-            "--",
-            shell, "-c", command,
-        ]
+        env = self._build_env(bwrap_cwd, custom_env)
+        bwrap_args = [*self._bwrap_argv(bwrap_cwd), shell, "-c", command]
 
         return await self._run_process(bwrap_args, env, encoding, command)
 
+    def _bwrap_argv(self, bwrap_cwd: str, *extra: str) -> list[str]:
+        """Build the bwrap sandbox argv up to and including the ``--`` separator.
+
+        ``extra`` options go after the sandbox's own mounts (so a bind under
+        /tmp is not hidden by its tmpfs).
+        """
+        return [*self._bwrap_prefix, "--chdir", bwrap_cwd, *_BWRAP_SANDBOX_ARGS[:-1], *extra, "--"]
+
     async def _exec_direct(
         self, command: str, options: ExecOptions | None = None
     ) -> str | bytes:
-        shell = self._detect_shell()
+        shell = self._shell_bin
         cwd = (options.cwd if options and options.cwd else self._root_dir) or self._root_dir
-        env = self._build_env(cwd, options.env if options else None)
         encoding = options.encoding if options else "utf8"
+        custom_env = options.env if options else None
+
+        if self._shell_pool_size > 0 and shell == "bash" and not custom_env:
+            pool = self._get_shell_pool(
+                lambda io_root: [shell, "--noprofile", "--norc"],
+                self._build_env(self._root_dir),
+                self._root_dir,
+            )
+            return await self._run_pooled(pool, cwd, encoding, command)
 
+        env = self._build_env(cwd, custom_env)
         return await self._run_process(
             [shell, "-c", command], env, encoding, command, cwd=cwd
         )
@@ -198,18 +292,61 @@ class LocalFilesystemBackend:
         command: str,
         cwd: str | None = None,
     ) -> str | bytes:
-        proc = await asyncio.create_subprocess_exec(
-            *args,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=env,
-            cwd=cwd,
-        )
-        stdout, stderr = await proc.communicate()
+        # Held for the command's whole runtime, so kept off the bounded shared I/O pool
+        stdout, stderr, returncode = await asyncio.to_thread(_spawn_and_wait, args, env, cwd)
+        return self._process_output(stdout, stderr, returncode, encoding, command)
+
+    def _get_shell_pool(
+        self,
+        build_argv: Callable[[str], list[str]],
+        env: dict[str, str],
+        cwd: str | None = None,
+    ) -> ShellPool:
+        """Return the shell pool, creating it on first use.
+
+        ``build_argv`` receives the directory holding the workers' output FIFOs,
+        which sandboxed workers must bind at the same path.
+        """
+        if self._shell_pool is None:
+            io_root = tempfile.mkdtemp(prefix="agentbe-shell-")
+            self._shell_pool = ShellPool(
+                build_argv(io_root), env, self._shell_pool_size, io_root, cwd
+            )
+        return self._shell_pool
+
+    async def _run_pooled(
+        self, pool: ShellPool, cwd: str, encoding: str, command: str
+    ) -> str | bytes:
+        try:
+            stdout, stderr, returncode = await pool.run(command, cwd)
+        except ShellWorkerError as e:
+            raise BackendError(str(e), ErrorCode.EXEC_ERROR, command) from e
+        return self._process_output(stdout, stderr, returncode, encoding, command)
 
-        if proc.returncode == 0:
+    def _process_output(
+        self,
+        stdout: bytes,
+        stderr: bytes,
+        returncode: int,
+        encoding: str,
+        command: str,
+    ) -> str | bytes:
+        if returncode == 0:
             if encoding == "buffer":
                 return stdout
+            if self._max_output_length and len(stdout) > self._max_output_length:
+                raw = stdout.strip(_STR_WHITESPACE_ASCII)
+                if raw.isascii():
+                    # One byte per character: slice before decoding so only
+                    # the kept prefix is decoded
+                    truncated_length = self._max_output_length - 50
+                    if len(raw) <= self._max_output_length:
+                        return raw.decode("ascii")
+                    return (
+                        f"{raw[:truncated_length].decode('ascii')}\n\n"
+                        f"... [Output truncated. Full output was {len(raw)} characters, "
+                        f"showing first {truncated_length}]"
+                    )
             output = stdout.decode("utf-8").strip()
             if self._max_output_length and len(output) > self._max_output_length:
                 truncated_length = self._max_output_length - 50
@@ -222,7 +359,7 @@ class LocalFilesystemBackend:
         else:
             error_msg = stderr.decode("utf-8").strip() or stdout.decode("utf-8").strip()
             raise BackendError(
-                f"Command execution failed with exit code {proc.returncode}: {error_msg}",
+                f"Command execution failed with exit code {returncode}: {error_msg}",
                 ErrorCode.EXEC_FAILED,
                 command,
             )
@@ -234,11 +371,7 @@ class LocalFilesystemBackend:
         encoding = options.encoding if options else "utf8"
 
         try:
-            if encoding == "buffer":
-                with open(full_path, "rb") as f:
-                    return f.read()
-            with open(full_path, encoding="utf-8") as f:
-                return f.read()
+            return await run_io(_read_file, full_path, encoding == "buffer")
         except OSError as e:
             raise BackendError(
                 f"Failed to read file: {relative_path}",
@@ -246,58 +379,84 @@ class LocalFilesystemBackend:
                 str(e),
             ) from e
 
-    async def write(self, relative_path: str, content: str | bytes) -> None:
+    async def read_stream(
+        self, relative_path: str, chunk_size: int = 65536
+    ) -> AsyncIterator[bytes]:
+        """Read a file as a stream of byte chunks.
+
+        Unlike ``read``, memory stays bounded by ``chunk_size`` for large files,
+        and the event loop gets a turn between chunks.
+        """
         full_path = self._resolve_path(relative_path)
 
         try:
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            if isinstance(content, bytes):
-                with open(full_path, "wb") as f:
-                    f.write(content)
-            else:
-                with open(full_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+            fd = await run_io(os.open, full_path, os.O_RDONLY)
+        except OSError as e:
+            raise BackendError(
+                f"Failed to read file: {relative_path}",
+                ErrorCode.READ_FAILED,
+                str(e),
+            ) from e
+
+        try:
+            while True:
+                try:
+                    chunk = await run_io(os.read, fd, chunk_size)
+                except OSError as e:
+                    raise BackendError(
+                        f"Failed to read file: {relative_path}",
+                        ErrorCode.READ_FAILED,
+                        str(e),
+                    ) from e
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            # Once submitted, the close runs on the pool even if this await is
+            # cancelled, so the fd is not leaked
+            await run_io(os.close, fd)
+
+    async def write(self, relative_path: str, content: str | bytes) -> None:
+        full_path, parent = self._resolve_path_and_parent(relative_path)
+        self._invalidate_stat_path(full_path)
+
+        try:
+            await run_io(_write_file, full_path, parent, content)
         except OSError as e:
             raise BackendError(
                 f"Failed to write file: {relative_path}",
                 ErrorCode.WRITE_FAILED,
                 str(e),
             ) from e
+        finally:
+            self._invalidate_stat_path(full_path)
 
     async def rename(self, old_path: str, new_path: str) -> None:
         full_old = self._resolve_path(old_path)
-        full_new = self._resolve_path(new_path)
+        full_new, new_parent = self._resolve_path_and_parent(new_path)
+        # Renaming a directory moves everything under it
+        self._invalidate_stat_path(None)
 
         try:
-            os.makedirs(os.path.dirname(full_new), exist_ok=True)
-            os.rename(full_old, full_new)
+            await run_io(_rename_path, full_old, full_new, new_parent)
         except OSError as e:
             raise BackendError(
                 f"Failed to rename {old_path} to {new_path}",
                 ErrorCode.WRITE_FAILED,
                 str(e),
             ) from e
+        finally:
+            self._invalidate_stat_path(None)
 
     async def rm(
         self, relative_path: str, *, recursive: bool = False, force: bool = False
     ) -> None:
         full_path = self._resolve_path(relative_path)
+        invalidated = None if recursive else full_path
+        self._invalidate_stat_path(invalidated)
 
         try:
-            if recursive:
-                if os.path.isdir(full_path):
-                    shutil.rmtree(full_path)
-                elif os.path.exists(full_path):
-                    os.remove(full_path)
-                elif not force:
-                    raise FileNotFoundError(f"Path not found: {relative_path}")
-            else:
-                if os.path.isdir(full_path):
-                    os.rmdir(full_path)
-                elif os.path.exists(full_path):
-                    os.remove(full_path)
-                elif not force:
-                    raise FileNotFoundError(f"Path not found: {relative_path}")
+            await run_io(_remove_path, full_path, recursive)
         except FileNotFoundError as e:
             if not force:
                 raise BackendError(
@@ -311,12 +470,49 @@ class LocalFilesystemBackend:
                 ErrorCode.WRITE_FAILED,
                 str(e),
             ) from e
+        finally:
+            self._invalidate_stat_path(invalidated)
 
     async def readdir(self, relative_path: str) -> list[str]:
         full_path = self._resolve_path(relative_path)
 
         try:
-            return sorted(os.listdir(full_path))
+            return await run_io(_list_dir, full_path)
+        except OSError as e:
+            raise BackendError(
+                f"Failed to read directory: {relative_path}",
+                ErrorCode.LS_FAILED,
+                str(e),
+            ) from e
+
+    async def readdir_stat(self, relative_path: str) -> list[tuple[str, FileStat]]:
+        """List a directory with stat info for each entry, sorted by name.
+
+        Saves a separate ``stat`` round trip per entry when callers need
+        both the listing and entry metadata.
+        """
+        full_path = self._resolve_path(relative_path)
+
+        try:
+            return await run_io(_list_dir_stat, full_path)
+        except OSError as e:
+            raise BackendError(
+                f"Failed to read directory: {relative_path}",
+                ErrorCode.LS_FAILED,
+                str(e),
+            ) from e
+
+    async def walk(self, relative_path: str = ".") -> list[tuple[str, FileStat]]:
+        """Recursively list a directory tree with stat info for every entry.
+
+        Returns ``(path, FileStat)`` pairs with paths relative to
+        ``relative_path``, sorted. Symlinked directories are reported but not
+        descended into. The whole traversal runs in one worker-thread hop.
+        """
+        full_path = self._resolve_path(relative_path)
+
+        try:
+            return await run_io(_walk_tree, full_path)
         except OSError as e:
             raise BackendError(
                 f"Failed to read directory: {relative_path}",
@@ -328,7 +524,7 @@ class LocalFilesystemBackend:
         full_path = self._resolve_path(relative_path)
 
         try:
-            os.makedirs(full_path, exist_ok=recursive)
+            await run_io(os.makedirs, full_path, exist_ok=recursive)
         except OSError as e:
             raise BackendError(
                 f"Failed to create directory: {relative_path}",
@@ -337,28 +533,41 @@ class LocalFilesystemBackend:
             ) from e
 
     async def touch(self, relative_path: str) -> None:
-        full_path = self._resolve_path(relative_path)
-        if not os.path.exists(full_path):
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            open(full_path, "w").close()
+        full_path, parent = self._resolve_path_and_parent(relative_path)
+        self._invalidate_stat_path(full_path)
+        try:
+            await run_io(_touch_file, full_path, parent)
+        finally:
+            self._invalidate_stat_path(full_path)
 
     async def exists(self, relative_path: str) -> bool:
+        """Check whether a path exists.
+
+        May report a stale ``True`` for up to 50 ms after the path is removed
+        by another process or backend instance (see :meth:`invalidate_stat`).
+        """
         full_path = self._resolve_path(relative_path)
-        return os.path.exists(full_path)
+        cached = self._stat_cache.get(full_path)
+        if cached is not None and time.monotonic() - cached[0] < _STAT_CACHE_TTL:
+            return True
+        return await run_io(os.path.exists, full_path)
 
     async def stat(self, relative_path: str) -> FileStat:
+        """Stat a path.
+
+        Results are cached briefly, so changes made by another process or
+        backend instance may be missed for up to 50 ms (see
+        :meth:`invalidate_stat`).
+        """
         full_path = self._resolve_path(relative_path)
+        cached = self._stat_cache.get(full_path)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < _STAT_CACHE_TTL:
+            return cached[1]
 
+        generation = self._stat_generation
         try:
-            st = os.stat(full_path)
-            import stat as stat_mod
-
-            return FileStat(
-                is_file=stat_mod.S_ISREG(st.st_mode),
-                is_directory=stat_mod.S_ISDIR(st.st_mode),
-                size=st.st_size,
-                modified=st.st_mtime,
-            )
+            file_stat = _to_file_stat(await run_io(os.stat, full_path))
         except OSError as e:
             raise BackendError(
                 f"Failed to stat path: {relative_path}",
@@ -366,6 +575,10 @@ class LocalFilesystemBackend:
                 str(e),
             ) from e
 
+        if generation == self._stat_generation:
+            self._stat_cache[full_path] = (now, file_stat)
+        return file_stat
+
     def scope(
         self, scope_path: str, config: ScopeConfig | None = None
     ) -> ScopedFilesystemBackend:
@@ -399,17 +612,154 @@ class LocalFilesystemBackend:
             root_dir=effective_root,
             isolation=self._isolation.value,
             shell=self._shell.value,
+            owner=self,
         )
         self._closeables.add(client)
         return client
 
     async def destroy(self) -> None:
-        for closeable in list(self._closeables):
+        if self._shell_pool is not None:
+            await self._shell_pool.close()
+            self._shell_pool = None
+        while self._closeables:
+            closeable = self._closeables.pop()
             try:
                 await closeable.close()
             except Exception:
                 pass
-        self._closeables.clear()
         self._active_scopes.clear()
         self._status_manager.set_status(ConnectionStatus.DESTROYED)
         self._status_manager.clear_listeners()
+
+
+@cache
+def _which_cached(name: str) -> str | None:
+    """``shutil.which`` memoized per process; PATH lookups stat every candidate."""
+    return shutil.which(name)
+
+
+# Blocking helpers, run on worker threads via run_io / asyncio.to_thread
+
+
+def _spawn_and_wait(
+    args: list[str], env: dict[str, str], cwd: str | None
+) -> tuple[bytes, bytes, int]:
+    with subprocess.Popen(
+        args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, cwd=cwd
+    ) as proc:
+        stdout, stderr = proc.communicate()
+    return stdout, stderr, proc.returncode
+
+
+def _list_dir(full_path: str) -> list[str]:
+    with os.scandir(full_path) as it:
+        names = [entry.name for entry in it]
+    names.sort()
+    return names
+
+
+def _to_file_stat(st: os.stat_result) -> FileStat:
+    file_type = S_IFMT(st.st_mode)
+    return FileStat(
+        is_file=file_type == S_IFREG,
+        is_directory=file_type == S_IFDIR,
+        size=st.st_size,
+        modified=st.st_mtime,
+    )
+
+
+def _entry_stat(entry: os.DirEntry[str]) -> FileStat:
+    try:
+        return _to_file_stat(entry.stat())
+    except FileNotFoundError:
+        # Dangling symlink: report the link itself
+        return _to_file_stat(entry.stat(follow_symlinks=False))
+
+
+def _list_dir_stat(full_path: str) -> list[tuple[str, FileStat]]:
+    with os.scandir(full_path) as it:
+        entries = [(entry.name, _entry_stat(entry)) for entry in it]
+    entries.sort(key=lambda item: item[0])
+    return entries
+
+
+def _walk_tree(full_path: str) -> list[tuple[str, FileStat]]:
+    entries: list[tuple[str, FileStat]] = []
+    pending = [("", full_path)]
+    while pending:
+        rel_dir, abs_dir = pending.pop()
+        with os.scandir(abs_dir) as it:
+            for entry in it:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                entries.append((rel, _entry_stat(entry)))
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((rel, entry.path))
+    entries.sort(key=lambda item: item[0])
+    return entries
+
+
+# O_NOATIME skips the access-time update but is only allowed for the file's owner
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+
+def _read_file(full_path: str, binary: bool) -> str | bytes:
+    # Raw fd reads skip the BufferedReader/TextIOWrapper layers of open()
+    try:
+        fd = os.open(full_path, os.O_RDONLY | _O_NOATIME)
+    except PermissionError:
+        if not _O_NOATIME:
+            raise
+        fd = os.open(full_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        # One extra byte: a regular file returns exactly `size` bytes at EOF
+        data = os.read(fd, size + 1)
+        if len(data) != size:
+            # Size changed or is not reported (procfs-style files); drain to EOF
+            chunks = [data]
+            while chunk := os.read(fd, 1 << 16):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+    finally:
+        os.close(fd)
+
+    if binary:
+        return data
+    text = data.decode("utf-8")
+    if "\r" in text:
+        # Match text-mode open(): universal newline translation
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _write_file(full_path: str, parent: str, content: str | bytes) -> None:
+    os.makedirs(parent, exist_ok=True)
+    if isinstance(content, bytes):
+        with open(full_path, "wb") as f:
+            f.write(content)
+    else:
+        with open(full_path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+def _rename_path(full_old: str, full_new: str, new_parent: str) -> None:
+    os.makedirs(new_parent, exist_ok=True)
+    os.rename(full_old, full_new)
+
+
+def _remove_path(full_path: str, recursive: bool) -> None:
+    if os.path.isdir(full_path):
+        if recursive:
+            shutil.rmtree(full_path)
+        else:
+            os.rmdir(full_path)
+    elif os.path.exists(full_path):
+        os.remove(full_path)
+    else:
+        raise FileNotFoundError(f"Path not found: {full_path}")
+
+
+def _touch_file(full_path: str, parent: str) -> None:
+    if not os.path.exists(full_path):
+        os.makedirs(parent, exist_ok=True)
+        open(full_path, "w").close()
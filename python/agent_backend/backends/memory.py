@@ -7,6 +7,10 @@ No exec support (throws NotImplementedBackendError).
 from __future__ import annotations
 
 import posixpath
+import sys
+import time
+import weakref
+from bisect import bisect_left, insort
 from typing import TYPE_CHECKING
 
 from agent_backend.backends.status import ConnectionStatusManager
@@ -38,12 +42,17 @@ class MemoryBackend:
         self._root_dir = config.root_dir if config else "/"
         self._status_manager = ConnectionStatusManager(ConnectionStatus.CONNECTED)
         self._store: dict[str, str | bytes] = {}
-        self._active_scopes: set[ScopedMemoryBackend] = set()
+        # Sorted view of the store's keys, so prefix queries are a bisect
+        # plus a scan of the matching range rather than a scan of every key
+        self._keys: list[str] = []
+        # Weak so scopes dropped without destroy() don't pin memory
+        self._active_scopes: weakref.WeakSet[ScopedMemoryBackend] = weakref.WeakSet()
         self._closeables: set[Closeable] = set()
 
         if config and config.initial_data:
             for key, value in config.initial_data.items():
-                self._store[key] = value
+                self._store[sys.intern(key)] = value
+        self._keys = sorted(self._store)
 
     @property
     def type(self) -> BackendType:
@@ -71,9 +80,12 @@ class MemoryBackend:
     async def read(
         self, key: str, options: ReadOptions | None = None
     ) -> str | bytes:
-        value = self._store.get(key)
-        if value is None:
-            raise BackendError(f"Key not found: {key}", ErrorCode.KEY_NOT_FOUND, "read")
+        try:
+            value = self._store[key]
+        except KeyError as e:
+            raise BackendError(
+                f"Key not found: {key}", ErrorCode.KEY_NOT_FOUND, "read"
+            ) from e
 
         if options and options.encoding == "buffer":
             if isinstance(value, str):
@@ -84,35 +96,47 @@ class MemoryBackend:
         return value
 
     async def write(self, key: str, content: str | bytes) -> None:
+        if key not in self._store:
+            # Store and index share one interned object per key, so repeat
+            # lookups with interned strings hit the identity fast path
+            key = sys.intern(key)
+            insort(self._keys, key)
         self._store[key] = content
 
     async def rename(self, old_key: str, new_key: str) -> None:
-        value = self._store.get(old_key)
-        if value is None:
+        try:
+            value = self._store.pop(old_key)
+        except KeyError as e:
             raise BackendError(
                 f"Key not found: {old_key}", ErrorCode.KEY_NOT_FOUND, "rename"
-            )
+            ) from e
+        self._unindex(old_key)
+        if new_key not in self._store:
+            new_key = sys.intern(new_key)
+            insort(self._keys, new_key)
         self._store[new_key] = value
-        del self._store[old_key]
 
     async def rm(
         self, key: str, *, recursive: bool = False, force: bool = False
     ) -> None:
         if recursive:
-            keys_to_delete: list[str] = []
             prefix = key if key.endswith("/") else f"{key}/"
+            removed = False
 
             if key in self._store:
-                keys_to_delete.append(key)
-
-            for k in self._store:
-                if k.startswith(prefix):
-                    keys_to_delete.append(k)
-
-            for k in keys_to_delete:
-                del self._store[k]
-
-            if not force and not keys_to_delete:
+                del self._store[key]
+                self._unindex(key)
+                removed = True
+
+            keys = self._keys
+            start, end = _prefix_range(keys, prefix)
+            if end > start:
+                for k in keys[start:end]:
+                    del self._store[k]
+                del keys[start:end]
+                removed = True
+
+            if not force and not removed:
                 raise BackendError(
                     f"Key not found: {key}", ErrorCode.KEY_NOT_FOUND, "rm"
                 )
@@ -124,23 +148,31 @@ class MemoryBackend:
                     )
             else:
                 del self._store[key]
+                self._unindex(key)
 
     async def readdir(self, prefix: str) -> list[str]:
         is_root = prefix in ("", ".", "/")
         normalized_prefix = "" if is_root else (prefix if prefix.endswith("/") else f"{prefix}/")
 
+        keys = self._keys
+        prefix_len = len(normalized_prefix)
         children: set[str] = set()
-        for key in self._store:
-            if is_root:
-                relative_path = key
-            elif key.startswith(normalized_prefix):
-                relative_path = key[len(normalized_prefix) :]
-            else:
+        idx = bisect_left(keys, normalized_prefix)
+        while idx < len(keys):
+            key = keys[idx]
+            if not key.startswith(normalized_prefix):
+                break
+            slash = key.find("/", prefix_len)
+            if slash == -1:
+                if len(key) > prefix_len:
+                    children.add(key[prefix_len:])
+                idx += 1
                 continue
-            parts = relative_path.split("/")
-            immediate_child = parts[0]
-            if immediate_child:
-                children.add(immediate_child)
+            if slash > prefix_len:
+                children.add(key[prefix_len:slash])
+            # Skip the rest of this child's subtree: every key under
+            # "<child>/" sorts before "<child>0" ("0" follows "/")
+            idx = bisect_left(keys, f"{key[:slash]}0", idx + 1)
 
         return sorted(children)
 
@@ -150,21 +182,27 @@ class MemoryBackend:
 
     async def touch(self, key: str) -> None:
         if key not in self._store:
+            key = sys.intern(key)
             self._store[key] = ""
+            insort(self._keys, key)
 
     async def exists(self, key: str) -> bool:
         return key in self._store
 
     async def stat(self, key: str) -> FileStat:
-        value = self._store.get(key)
-        if value is None:
+        try:
+            value = self._store[key]
+        except KeyError as e:
             raise BackendError(
                 f"Key not found: {key}", ErrorCode.KEY_NOT_FOUND, "stat"
-            )
-
-        size = len(value.encode("utf-8")) if isinstance(value, str) else len(value)
-        import time
+            ) from e
 
+        # str.isascii() reads a flag CPython keeps on the string, so ASCII text
+        # (its UTF-8 length equals its length) is sized without encoding a copy
+        if isinstance(value, str) and not value.isascii():
+            size = len(value.encode("utf-8"))
+        else:
+            size = len(value)
         return FileStat(
             is_file=True,
             is_directory=False,
@@ -201,20 +239,21 @@ class MemoryBackend:
             posixpath.join(self._root_dir, scope_path) if scope_path else self._root_dir
         )
         client = await create_mcp_client(
-            backend_type="memory", root_dir=effective_root
+            backend_type="memory", root_dir=effective_root, owner=self
         )
         self._closeables.add(client)
         return client
 
     async def destroy(self) -> None:
-        for closeable in list(self._closeables):
+        while self._closeables:
+            closeable = self._closeables.pop()
             try:
                 await closeable.close()
             except Exception:
                 pass
-        self._closeables.clear()
         self._active_scopes.clear()
         self._store.clear()
+        self._keys.clear()
         self._status_manager.set_status(ConnectionStatus.DESTROYED)
         self._status_manager.clear_listeners()
 
@@ -222,14 +261,39 @@ class MemoryBackend:
 
     async def delete(self, key: str) -> None:
         """Delete a key (memory-specific helper)."""
-        self._store.pop(key, None)
+        if self._store.pop(key, None) is not None:
+            self._unindex(key)
 
     async def clear(self) -> None:
         """Clear all keys (memory-specific helper)."""
         self._store.clear()
+        self._keys.clear()
 
     async def list_keys(self, prefix: str | None = None) -> list[str]:
         """List all keys matching prefix (memory-specific helper)."""
         if not prefix:
-            return sorted(self._store.keys())
-        return sorted(k for k in self._store if k.startswith(prefix))
+            return list(self._keys)
+        start, end = _prefix_range(self._keys, prefix)
+        return self._keys[start:end]
+
+    def _unindex(self, key: str) -> None:
+        idx = bisect_left(self._keys, key)
+        if idx < len(self._keys) and self._keys[idx] == key:
+            del self._keys[idx]
+
+
+def _prefix_range(keys: list[str], prefix: str) -> tuple[int, int]:
+    """Index range of the sorted ``keys`` that start with a non-empty ``prefix``.
+
+    Keys starting with ``prefix`` are exactly those in ``[prefix, upper)``,
+    where ``upper`` bumps the prefix's last character, so both ends are found
+    by bisection rather than by walking the matches.
+    """
+    start = bisect_left(keys, prefix)
+    last = ord(prefix[-1])
+    if last == sys.maxunicode:
+        end = start
+        while end < len(keys) and keys[end].startswith(prefix):
+            end += 1
+        return start, end
+    return start, bisect_left(keys, prefix[:-1] + chr(last + 1), start)
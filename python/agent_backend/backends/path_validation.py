@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import os.path
 import posixpath
+from functools import lru_cache
 from types import ModuleType
 
 from agent_backend.types import PathEscapeError
@@ -41,15 +42,104 @@ def validate_within_boundary(
         PathEscapeError: If path escapes boundary.
     """
     pathmod = _get_pathmod(use_posix)
+    if is_trusted_relative(relative_path, pathmod):
+        boundary_resolved = _resolve(boundary, pathmod)
+        if boundary == boundary_resolved != pathmod.sep:
+            return boundary_resolved + pathmod.sep + relative_path
+
+    ok, value = _validate_cached(relative_path, boundary, use_posix)
+    if not ok:
+        raise PathEscapeError(relative_path)
+    return value
+
+
+def validate_within_boundary_fast(
+    relative_path: str,
+    boundary: str,
+    boundary_resolved: str,
+    boundary_prefix: str,
+    pathmod: ModuleType,
+) -> str:
+    """Validate a path against a boundary whose resolved form is precomputed.
+
+    Same semantics as validate_within_boundary, for callers with a fixed
+    boundary that compute ``boundary_resolved`` (``normpath(join("/", boundary))``)
+    and ``boundary_prefix`` (``boundary_resolved + sep``) once up front.
+
+    Raises:
+        PathEscapeError: If path escapes boundary.
+    """
+    if boundary == boundary_resolved != pathmod.sep and is_trusted_relative(relative_path, pathmod):
+        return boundary_prefix + relative_path
+
+    ok, value = _check_within_boundary(
+        relative_path, boundary, boundary_resolved, boundary_prefix, pathmod
+    )
+    if not ok:
+        raise PathEscapeError(relative_path)
+    return value
+
+
+def is_trusted_relative(relative_path: str, pathmod: ModuleType) -> bool:
+    """Whether a path is a plain normalized relative path like ``src/main.py``.
+
+    Such a path cannot escape the boundary and joining it onto a normalized
+    boundary is already normalized, so full resolution can be skipped.
+    """
+    return (
+        pathmod.sep == "/"
+        and relative_path != ""
+        and not relative_path.startswith(("/", "."))
+        and not relative_path.endswith(("/", "/."))
+        and ".." not in relative_path
+        and "//" not in relative_path
+        and "/./" not in relative_path
+    )
+
+
+def trusted_join_prefix(boundary: str, pathmod: ModuleType) -> str | None:
+    """Prefix a trusted relative path can be appended to without validation.
+
+    Validating a trusted relative path against ``boundary`` yields the
+    normalized boundary joined with the path, so the normalized boundary plus
+    a separator is computed once here. Returns None for boundaries that
+    normalize to the current directory, the filesystem root, or a parent
+    directory, which still need full resolution.
+    """
+    normalized = pathmod.normpath(boundary) if boundary else boundary
+    if normalized in ("", ".", "..", pathmod.sep) or normalized.startswith(".." + pathmod.sep):
+        return None
+    return normalized + pathmod.sep
+
+
+@lru_cache(maxsize=4096)
+def _validate_cached(relative_path: str, boundary: str, use_posix: bool) -> tuple[bool, str]:
+    """Memoized core of validate_within_boundary.
+
+    Returns ``(True, combined_path)`` on success and ``(False, relative_path)``
+    when the path escapes, so rejected paths are cached as well.
+    """
+    pathmod = _get_pathmod(use_posix)
     boundary_resolved = _resolve(boundary, pathmod)
+    return _check_within_boundary(
+        relative_path, boundary, boundary_resolved, boundary_resolved + pathmod.sep, pathmod
+    )
+
 
+def _check_within_boundary(
+    relative_path: str,
+    boundary: str,
+    boundary_resolved: str,
+    boundary_prefix: str,
+    pathmod: ModuleType,
+) -> tuple[bool, str]:
+    """Shared resolution logic returning ``(ok, combined_path_or_input)``."""
     # Check if path is absolute and already within boundary
     if pathmod.isabs(relative_path):
         path_resolved = _resolve(relative_path, pathmod)
 
-        sep = pathmod.sep
-        if path_resolved.startswith(boundary_resolved + sep) or path_resolved == boundary_resolved:
-            return path_resolved
+        if path_resolved.startswith(boundary_prefix) or path_resolved == boundary_resolved:
+            return True, path_resolved
 
         # Absolute path doesn't match boundary - treat as relative (strip leading slashes)
 
@@ -65,11 +155,10 @@ def validate_within_boundary(
     resolved = _resolve(combined, pathmod)
 
     # Validate stays within boundary
-    sep = pathmod.sep
-    if not resolved.startswith(boundary_resolved + sep) and resolved != boundary_resolved:
-        raise PathEscapeError(relative_path)
+    if not resolved.startswith(boundary_prefix) and resolved != boundary_resolved:
+        return False, relative_path
 
-    return pathmod.normpath(combined)
+    return True, pathmod.normpath(combined)
 
 
 def validate_absolute_within_root(
@@ -88,15 +177,22 @@ def validate_absolute_within_root(
     Raises:
         PathEscapeError: If path is outside root_dir.
     """
+    if not _is_within_root_cached(absolute_path, root_dir, use_posix):
+        raise PathEscapeError(absolute_path)
+
+
+@lru_cache(maxsize=4096)
+def _is_within_root_cached(absolute_path: str, root_dir: str, use_posix: bool) -> bool:
+    """Memoized core of validate_absolute_within_root."""
     pathmod = _get_pathmod(use_posix)
     normalized_path = _resolve(absolute_path, pathmod)
     normalized_root = _resolve(root_dir, pathmod)
 
     sep = pathmod.sep
-    if not normalized_path.startswith(normalized_root + sep) and normalized_path != normalized_root:
-        raise PathEscapeError(absolute_path)
+    return normalized_path.startswith(normalized_root + sep) or normalized_path == normalized_root
 
 
+@lru_cache(maxsize=4096)
 def _resolve(p: str, pathmod: ModuleType) -> str:
     """Resolve a path to its normalized absolute form."""
     return pathmod.normpath(pathmod.join("/", p))
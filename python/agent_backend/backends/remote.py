@@ -9,6 +9,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import posixpath
+import weakref
+from stat import S_IFDIR, S_IFMT, S_IFREG
 from typing import TYPE_CHECKING
 
 from agent_backend.backends.path_validation import (
@@ -34,6 +36,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Checked before every operation; module-level references skip the enum
+# member descriptor lookup
+_CONNECTED = ConnectionStatus.CONNECTED
+_DESTROYED = ConnectionStatus.DESTROYED
+
 
 class RemoteFilesystemBackend:
     """Remote filesystem backend.
@@ -60,7 +67,8 @@ class RemoteFilesystemBackend:
 
         self._status_manager = ConnectionStatusManager(ConnectionStatus.DISCONNECTED)
         self._transport: WebSocketSSHTransport | None = None
-        self._active_scopes: set[object] = set()
+        # Weak so scopes dropped without destroy() don't pin memory
+        self._active_scopes: weakref.WeakSet[object] = weakref.WeakSet()
         self._closeables: set[Closeable] = set()
         self._reconnect_task: asyncio.Task[None] | None = None
         self._retry_count = 0
@@ -97,6 +105,7 @@ class RemoteFilesystemBackend:
                 auth_token=self._auth_token,
                 keepalive_interval=self._keepalive_interval,
                 keepalive_count_max=self._keepalive_count_max,
+                sftp_pool_size=self._config.sftp_pool_size,
             )
             await self._transport.connect()
             self._status_manager.set_status(ConnectionStatus.CONNECTED)
@@ -109,9 +118,10 @@ class RemoteFilesystemBackend:
 
     async def _ensure_connected(self) -> None:
         """Ensure transport is connected, connecting if needed."""
-        if self._status_manager.status == ConnectionStatus.DESTROYED:
+        status = self._status_manager.status
+        if status == _DESTROYED:
             raise BackendError("Backend is destroyed", ErrorCode.CONNECTION_CLOSED)
-        if self._status_manager.status == ConnectionStatus.CONNECTED and self._transport:
+        if status == _CONNECTED and self._transport:
             return
         await self.connect()
 
@@ -359,11 +369,11 @@ class RemoteFilesystemBackend:
         sftp = await self._transport.get_sftp()
         try:
             attrs = await sftp.stat(full_path)
-            import stat as stat_mod
+            file_type = S_IFMT(attrs.permissions or 0)
 
             return FileStat(
-                is_file=stat_mod.S_ISREG(attrs.permissions or 0),
-                is_directory=stat_mod.S_ISDIR(attrs.permissions or 0),
+                is_file=file_type == S_IFREG,
+                is_directory=file_type == S_IFDIR,
                 size=attrs.size or 0,
                 modified=attrs.mtime or 0.0,
             )
@@ -418,12 +428,12 @@ class RemoteFilesystemBackend:
             self._reconnect_task.cancel()
             self._reconnect_task = None
 
-        for closeable in list(self._closeables):
+        while self._closeables:
+            closeable = self._closeables.pop()
             try:
                 await closeable.close()
             except Exception:
                 pass
-        self._closeables.clear()
 
         if self._transport:
             await self._transport.close()
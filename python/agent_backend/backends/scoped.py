@@ -6,12 +6,22 @@ import asyncio
 import os
 import os.path
 import posixpath
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
-from agent_backend.backends.path_validation import validate_within_boundary
+from agent_backend.backends.path_validation import (
+    is_trusted_relative,
+    trusted_join_prefix,
+    validate_within_boundary,
+    validate_within_boundary_fast,
+)
 from agent_backend.types import NotImplementedBackendError
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from agent_backend.backends.base import Closeable
     from agent_backend.backends.local import LocalFilesystemBackend
     from agent_backend.backends.memory import MemoryBackend
@@ -26,6 +36,10 @@ if TYPE_CHECKING:
     )
 
 
+# Deletes issued concurrently per batch by ScopedMemoryBackend.clear()
+_CLEAR_BATCH_SIZE = 256
+
+
 class ScopedMemoryBackend:
     """Scoped memory backend implementation.
 
@@ -39,8 +53,17 @@ class ScopedMemoryBackend:
         config: ScopeConfig | None = None,
     ) -> None:
         self._parent = parent
-        self._scope_path = scope_path if scope_path.endswith("/") else f"{scope_path}/"
-        self._root_dir = posixpath.join(parent.root_dir, self._scope_path)
+        # Interned so nested scopes and the memoized path transforms below
+        # share one object per distinct path and compare by identity first
+        self._scope_path = sys.intern(
+            scope_path if scope_path.endswith("/") else f"{scope_path}/"
+        )
+        self._root_dir = sys.intern(posixpath.join(parent.root_dir, self._scope_path))
+        self._scope_for_validation = sys.intern(self._scope_path.rstrip("/"))
+        self._root_normalized = sys.intern(posixpath.normpath(posixpath.join("/", self._root_dir)))
+        self._root_prefix = sys.intern(self._root_normalized + "/")
+        # Plain relative keys join the normalized scope without validation
+        self._key_prefix = trusted_join_prefix(self._scope_for_validation, posixpath)
         self._operations_logger = config.operations_logger if config else None
 
     @property
@@ -76,19 +99,13 @@ class ScopedMemoryBackend:
 
     def _scope_key(self, key: str) -> str:
         """Combine scope path with key and validate scope boundary."""
-        scope_for_validation = self._scope_path.rstrip("/")
-
-        if posixpath.isabs(key):
-            normalized = posixpath.normpath(posixpath.join("/", key))
-            root_normalized = posixpath.normpath(posixpath.join("/", self._root_dir))
-
-            if normalized.startswith(root_normalized + "/"):
-                relative_part = normalized[len(root_normalized) + 1 :]
-                return posixpath.join(scope_for_validation, relative_part)
-            elif normalized == root_normalized or normalized == root_normalized + "/":
-                return scope_for_validation
-
-        return validate_within_boundary(key, scope_for_validation, use_posix=True)
+        if key[:1] != "/":
+            if self._key_prefix is not None and is_trusted_relative(key, posixpath):
+                return self._key_prefix + key
+            return validate_within_boundary(key, self._scope_for_validation, use_posix=True)
+        return _compute_scope_key(
+            self._scope_for_validation, self._root_normalized, self._root_prefix, key
+        )
 
     async def read(
         self, key: str, options: ReadOptions | None = None
@@ -128,7 +145,7 @@ class ScopedMemoryBackend:
     def scope(
         self, nested_path: str, config: ScopeConfig | None = None
     ) -> ScopedMemoryBackend:
-        combined_path = posixpath.join(self._scope_path, nested_path)
+        combined_path = _fast_join(self._scope_path, nested_path)
         from agent_backend.types import ScopeConfig as ScopeConfigCls
 
         merged_config = ScopeConfigCls(
@@ -138,13 +155,13 @@ class ScopedMemoryBackend:
 
     async def get_mcp_transport(self, scope_path: str | None = None) -> object:
         full_scope_path = (
-            posixpath.join(self._scope_path, scope_path) if scope_path else self._scope_path
+            _fast_join(self._scope_path, scope_path) if scope_path else self._scope_path
         )
         return await self._parent.get_mcp_transport(full_scope_path)
 
     async def get_mcp_client(self, scope_path: str | None = None) -> object:
         full_scope_path = (
-            posixpath.join(self._scope_path, scope_path) if scope_path else self._scope_path
+            _fast_join(self._scope_path, scope_path) if scope_path else self._scope_path
         )
         return await self._parent.get_mcp_client(full_scope_path)
 
@@ -161,13 +178,16 @@ class ScopedMemoryBackend:
 
     async def clear(self) -> None:
         keys = await self._parent.list_keys(self._scope_path)
-        for key in keys:
-            await self._parent.delete(key)
+        for i in range(0, len(keys), _CLEAR_BATCH_SIZE):
+            await asyncio.gather(
+                *(self._parent.delete(key) for key in keys[i : i + _CLEAR_BATCH_SIZE])
+            )
 
     async def list_keys(self, prefix: str | None = None) -> list[str]:
         scoped_prefix = self._scope_key(prefix) if prefix else self._scope_path
         keys = await self._parent.list_keys(scoped_prefix)
-        return [k[len(self._scope_path) :] for k in keys]
+        prefix_len = len(self._scope_path)
+        return [k[prefix_len:] for k in keys]
 
 
 class ScopedFilesystemBackend:
@@ -183,9 +203,16 @@ class ScopedFilesystemBackend:
         config: ScopeConfig | None = None,
     ) -> None:
         self._parent = parent
-        self._scope_path = scope_path
-        self._root_dir = os.path.join(parent.root_dir, scope_path)
-        self._custom_env = config.env if config else {}
+        # Interned as in ScopedMemoryBackend
+        self._scope_path = sys.intern(scope_path)
+        self._scope_resolved = sys.intern(os.path.normpath(os.path.join("/", scope_path)))
+        self._scope_prefix = sys.intern(self._scope_resolved + os.sep)
+        self._root_dir = sys.intern(os.path.join(parent.root_dir, scope_path))
+        self._root_normalized = sys.intern(os.path.normpath(self._root_dir))
+        self._root_prefix = sys.intern(self._root_normalized + os.sep)
+        self._path_prefix = trusted_join_prefix(scope_path, os.path)
+        # Read-only, so _merge_env can hand it to exec without copying
+        self._custom_env: Mapping[str, str] = MappingProxyType(dict(config.env) if config else {})
         self._operations_logger = config.operations_logger if config else None
         self._root_ensured = False
         self._root_ensure_lock = asyncio.Lock()
@@ -220,7 +247,11 @@ class ScopedFilesystemBackend:
         self._parent.track_closeable(closeable)
 
     async def _ensure_root(self) -> None:
-        """Ensure the scope root directory exists. Deduped."""
+        """Ensure the scope root directory exists. Deduped.
+
+        Call sites check ``_root_ensured`` first so that, once the root
+        exists, they skip creating and awaiting this coroutine entirely.
+        """
         if self._root_ensured:
             return
         async with self._root_ensure_lock:
@@ -232,29 +263,35 @@ class ScopedFilesystemBackend:
 
     def _to_parent_path(self, relative_path: str) -> str:
         """Convert relative path to parent-relative path."""
-        if os.path.isabs(relative_path):
-            normalized = os.path.normpath(relative_path)
-            root_normalized = os.path.normpath(self._root_dir)
-
-            if normalized.startswith(root_normalized + os.sep):
-                relative_part = normalized[len(root_normalized) + 1 :]
-                return os.path.join(self._scope_path, relative_part)
-            elif normalized == root_normalized:
-                return self._scope_path
-
-        return validate_within_boundary(relative_path, self._scope_path)
+        if not os.path.isabs(relative_path):
+            if self._path_prefix is not None and is_trusted_relative(relative_path, os.path):
+                return self._path_prefix + relative_path
+            return validate_within_boundary_fast(
+                relative_path, self._scope_path, self._scope_resolved, self._scope_prefix, os.path
+            )
+        return _compute_parent_path(
+            self._scope_path,
+            self._scope_resolved,
+            self._scope_prefix,
+            self._root_normalized,
+            self._root_prefix,
+            relative_path,
+        )
 
     def _merge_env(
-        self, command_env: dict[str, str] | None = None
-    ) -> dict[str, str] | None:
-        if not self._custom_env and not command_env:
-            return None
-        return {**self._custom_env, **(command_env or {})}
+        self, command_env: Mapping[str, str] | None = None
+    ) -> Mapping[str, str] | None:
+        if not self._custom_env:
+            return command_env or None
+        if not command_env:
+            return self._custom_env
+        return {**self._custom_env, **command_env}
 
     async def exec(
         self, command: str, options: ExecOptions | None = None
     ) -> str | bytes:
-        await self._ensure_root()
+        if not self._root_ensured:
+            await self._ensure_root()
         from agent_backend.types import ExecOptions as ExecOptionsCls
 
         merged_env = self._merge_env(options.env if options else None)
@@ -271,11 +308,13 @@ class ScopedFilesystemBackend:
         return await self._parent.read(self._to_parent_path(path), options)
 
     async def write(self, path: str, content: str | bytes) -> None:
-        await self._ensure_root()
+        if not self._root_ensured:
+            await self._ensure_root()
         await self._parent.write(self._to_parent_path(path), content)
 
     async def rename(self, old_path: str, new_path: str) -> None:
-        await self._ensure_root()
+        if not self._root_ensured:
+            await self._ensure_root()
         await self._parent.rename(
             self._to_parent_path(old_path), self._to_parent_path(new_path)
         )
@@ -288,15 +327,18 @@ class ScopedFilesystemBackend:
         )
 
     async def readdir(self, path: str) -> list[str]:
-        await self._ensure_root()
+        if not self._root_ensured:
+            await self._ensure_root()
         return await self._parent.readdir(self._to_parent_path(path))
 
     async def mkdir(self, path: str, *, recursive: bool = True) -> None:
-        await self._ensure_root()
+        if not self._root_ensured:
+            await self._ensure_root()
         await self._parent.mkdir(self._to_parent_path(path), recursive=recursive)
 
     async def touch(self, path: str) -> None:
-        await self._ensure_root()
+        if not self._root_ensured:
+            await self._ensure_root()
         await self._parent.touch(self._to_parent_path(path))
 
     async def exists(self, path: str) -> bool:
@@ -308,7 +350,7 @@ class ScopedFilesystemBackend:
     def scope(
         self, nested_path: str, config: ScopeConfig | None = None
     ) -> ScopedFilesystemBackend:
-        combined_path = os.path.join(self._scope_path, nested_path)
+        combined_path = _fast_join(self._scope_path, nested_path)
         from agent_backend.types import ScopeConfig as ScopeConfigCls
 
         merged_config = ScopeConfigCls(
@@ -322,13 +364,13 @@ class ScopedFilesystemBackend:
 
     async def get_mcp_transport(self, scope_path: str | None = None) -> object:
         full_scope_path = (
-            os.path.join(self._scope_path, scope_path) if scope_path else self._scope_path
+            _fast_join(self._scope_path, scope_path) if scope_path else self._scope_path
         )
         return await self._parent.get_mcp_transport(full_scope_path)
 
     async def get_mcp_client(self, scope_path: str | None = None) -> object:
         full_scope_path = (
-            os.path.join(self._scope_path, scope_path) if scope_path else self._scope_path
+            _fast_join(self._scope_path, scope_path) if scope_path else self._scope_path
         )
         return await self._parent.get_mcp_client(full_scope_path)
 
@@ -337,3 +379,55 @@ class ScopedFilesystemBackend:
 
     async def on_child_destroyed(self, child: object) -> None:
         await self._parent.on_child_destroyed(child)
+
+
+def _fast_join(base: str, path: str) -> str:
+    """``posixpath.join`` for two path segments, without the generic machinery."""
+    if path.startswith("/"):
+        return path
+    if not base or base.endswith("/"):
+        return base + path
+    return f"{base}/{path}"
+
+
+# Absolute-path transforms are pure functions of immutable per-scope strings
+# and the requested path, so results are memoized across calls and scope
+# instances. Relative paths skip these and go straight to boundary validation.
+# Escapes raise PathEscapeError, which lru_cache does not cache.
+
+
+@lru_cache(maxsize=4096)
+def _compute_scope_key(
+    scope_for_validation: str, root_normalized: str, root_prefix: str, key: str
+) -> str:
+    normalized = posixpath.normpath(posixpath.join("/", key))
+
+    if normalized.startswith(root_prefix):
+        relative_part = normalized[len(root_prefix) :]
+        return posixpath.join(scope_for_validation, relative_part)
+    elif normalized in (root_normalized, root_prefix):
+        return scope_for_validation
+
+    return validate_within_boundary(key, scope_for_validation, use_posix=True)
+
+
+@lru_cache(maxsize=4096)
+def _compute_parent_path(
+    scope_path: str,
+    scope_resolved: str,
+    scope_prefix: str,
+    root_normalized: str,
+    root_prefix: str,
+    absolute_path: str,
+) -> str:
+    normalized = os.path.normpath(absolute_path)
+
+    if normalized.startswith(root_prefix):
+        relative_part = normalized[len(root_prefix) :]
+        return os.path.join(scope_path, relative_part)
+    elif normalized == root_normalized:
+        return scope_path
+
+    return validate_within_boundary_fast(
+        absolute_path, scope_path, scope_resolved, scope_prefix, os.path
+    )
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import time
 from collections.abc import Callable
+from time import time as _now
 
 from agent_backend.types import ConnectionStatus, StatusChangeEvent
 
@@ -19,7 +19,8 @@ class ConnectionStatusManager:
 
     def __init__(self, initial_status: ConnectionStatus) -> None:
         self._status = initial_status
-        self._listeners: set[StatusChangeCallback] = set()
+        # Immutable snapshot replaced on (un)subscribe, so dispatch needs no copy
+        self._listeners: tuple[StatusChangeCallback, ...] = ()
 
     @property
     def status(self) -> ConnectionStatus:
@@ -34,19 +35,24 @@ class ConnectionStatusManager:
 
         No-op if the new status is the same as the current status.
         """
-        if self._status == new_status:
+        old_status = self._status
+        # Statuses are enum singletons, so identity is equality
+        if old_status is new_status:
+            return
+
+        self._status = new_status
+        listeners = self._listeners
+        if not listeners:
             return
 
         event = StatusChangeEvent(
-            from_status=self._status,
+            from_status=old_status,
             to_status=new_status,
-            timestamp=time.time(),
+            timestamp=_now(),
             error=error,
         )
 
-        self._status = new_status
-
-        for listener in list(self._listeners):
+        for listener in listeners:
             try:
                 listener(event)
             except Exception:
@@ -55,13 +61,14 @@ class ConnectionStatusManager:
 
     def on_status_change(self, cb: StatusChangeCallback) -> Unsubscribe:
         """Subscribe to status changes. Returns an unsubscribe function."""
-        self._listeners.add(cb)
+        if cb not in self._listeners:
+            self._listeners = (*self._listeners, cb)
 
         def unsubscribe() -> None:
-            self._listeners.discard(cb)
+            self._listeners = tuple(listener for listener in self._listeners if listener != cb)
 
         return unsubscribe
 
     def clear_listeners(self) -> None:
         """Remove all listeners. Called during destroy."""
-        self._listeners.clear()
+        self._listeners = ()
@@ -8,10 +8,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import asyncssh
-import websockets
+# asyncssh and websockets are imported where used, so importing the package
+# does not pay for loading them unless a remote backend actually connects
+if TYPE_CHECKING:
+    import asyncssh
+    import websockets
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +74,8 @@ class _WebSocketTransport(asyncio.Transport):
         self._read_task = asyncio.ensure_future(self._read_loop(protocol))
 
     async def _read_loop(self, protocol: asyncio.Protocol) -> None:
+        import websockets
+
         try:
             async for message in self._ws:
                 if isinstance(message, bytes):
@@ -127,6 +132,7 @@ class WebSocketSSHTransport:
         auth_token: str | None = None,
         keepalive_interval: float = 30.0,
         keepalive_count_max: int = 3,
+        sftp_pool_size: int = 1,
     ) -> None:
         self._host = host
         self._port = port
@@ -135,7 +141,12 @@ class WebSocketSSHTransport:
         self._keepalive_count_max = keepalive_count_max
         self._ws: websockets.ClientConnection | None = None
         self._ssh_conn: asyncssh.SSHClientConnection | None = None
-        self._sftp: asyncssh.SFTPClient | None = None
+        # SFTP sessions handed out round-robin; one channel serializes its
+        # requests, so a few sessions let concurrent file ops overlap
+        self._sftp_pool: list[asyncssh.SFTPClient] = []
+        self._sftp_pool_size = max(1, sftp_pool_size)
+        self._sftp_next = 0
+        self._sftp_lock = asyncio.Lock()
         self._connected = False
 
     @property
@@ -144,13 +155,25 @@ class WebSocketSSHTransport:
 
     async def connect(self) -> None:
         """Establish WebSocket connection and SSH session over it."""
+        import asyncssh
+        import websockets
+
         protocol = "ws"
         headers = {}
         if self._auth_token:
             headers["Authorization"] = f"Bearer {self._auth_token}"
 
         ws_url = f"{protocol}://{self._host}:{self._port}/ssh"
-        self._ws = await websockets.connect(ws_url, additional_headers=headers)
+        # The tunneled SSH stream is encrypted and won't compress, so skip
+        # permessage-deflate; SSH does its own framing, so lift the message
+        # size cap and buffer more before send() applies backpressure
+        self._ws = await websockets.connect(
+            ws_url,
+            additional_headers=headers,
+            compression=None,
+            max_size=None,
+            write_limit=2**20,
+        )
 
         # Create an SSH connection tunneled over the WebSocket.
         # We wrap the WebSocket in a _WebSocketTunnel that implements the
@@ -169,12 +192,22 @@ class WebSocketSSHTransport:
         self._connected = True
 
     async def get_sftp(self) -> asyncssh.SFTPClient:
-        """Get or create an SFTP session."""
-        if self._sftp is None:
-            if not self._ssh_conn:
-                raise ConnectionError("SSH connection not established")
-            self._sftp = await self._ssh_conn.start_sftp_client()
-        return self._sftp
+        """Get an SFTP session, starting pooled sessions on demand.
+
+        The lock ensures concurrent callers never start more than
+        ``sftp_pool_size`` SFTP subsystems.
+        """
+        if len(self._sftp_pool) < self._sftp_pool_size:
+            async with self._sftp_lock:
+                if len(self._sftp_pool) < self._sftp_pool_size:
+                    if not self._ssh_conn:
+                        raise ConnectionError("SSH connection not established")
+                    sftp = await self._ssh_conn.start_sftp_client()
+                    self._sftp_pool.append(sftp)
+                    return sftp
+        sftp = self._sftp_pool[self._sftp_next % len(self._sftp_pool)]
+        self._sftp_next += 1
+        return sftp
 
     async def run(self, command: str, **kwargs: object) -> asyncssh.SSHCompletedProcess:
         """Run a command over SSH."""
@@ -185,9 +218,9 @@ class WebSocketSSHTransport:
     async def close(self) -> None:
         """Close all connections."""
         self._connected = False
-        if self._sftp:
-            self._sftp.exit()
-            self._sftp = None
+        while self._sftp_pool:
+            self._sftp_pool.pop().exit()
+        self._sftp_next = 0
         if self._ssh_conn:
             self._ssh_conn.close()
             await self._ssh_conn.wait_closed()
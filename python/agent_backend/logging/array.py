@@ -2,41 +2,141 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING
+
 from agent_backend.logging.types import OperationLogEntry
-from agent_backend.types import LoggingMode
+from agent_backend.types import LoggingMode, OperationType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Entry logged via log_raw: the first eight OperationLogEntry fields, in order
+_RawEntry = tuple[float, OperationType, str, str, str, str, bool, float]
+_Stored = OperationLogEntry | _RawEntry
 
 
 class ArrayOperationsLogger:
     """In-memory array-based operations logger.
 
-    Stores all logged operations in a list for later retrieval.
+    Stores logged operations in memory for later retrieval.
     Useful for testing, debugging, or building audit trails.
+
+    Pass ``max_entries`` to keep only the most recent entries; by default
+    every entry is kept. Entries logged with ``log_raw`` are stored as tuples
+    and built into ``OperationLogEntry`` objects when retrieved.
     """
 
-    def __init__(self, mode: LoggingMode = LoggingMode.STANDARD) -> None:
+    __slots__ = (
+        "_by_operation",
+        "_by_status",
+        "_entries",
+        "_has_raw",
+        "_max_entries",
+        "_mode",
+        "_time_ordered",
+        "_timestamps",
+    )
+
+    def __init__(
+        self,
+        mode: LoggingMode = LoggingMode.STANDARD,
+        max_entries: int | None = None,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
         self._mode = mode
-        self._entries: list[OperationLogEntry] = []
+        self._max_entries = max_entries
+        # Indices kept in step with _entries; _append evicts the oldest entry,
+        # which is also the oldest in each index, before exceeding max_entries
+        self._entries: deque[_Stored] = deque()
+        self._timestamps: deque[float] = deque()
+        self._by_operation: dict[str, deque[_Stored]] = {}
+        self._by_status: tuple[deque[_Stored], deque[_Stored]] = (
+            deque(),
+            deque(),
+        )
+        # Range queries bisect _timestamps while entries arrive in time order
+        self._time_ordered = True
+        # Until log_raw is used every stored item is already an entry, and
+        # getters can copy the index with list() instead of checking each item
+        self._has_raw = False
 
     @property
     def mode(self) -> LoggingMode:
         return self._mode
 
     def log(self, entry: OperationLogEntry) -> None:
-        self._entries.append(entry)
+        self._append(entry, entry.timestamp, entry.operation, entry.success)
+
+    def log_raw(
+        self,
+        timestamp: float,
+        operation: OperationType,
+        user_id: str,
+        workspace_name: str,
+        workspace_path: str,
+        command: str,
+        success: bool,
+        duration_ms: float,
+    ) -> None:
+        """Log an entry with no output fields without building an OperationLogEntry."""
+        self._has_raw = True
+        self._append(
+            (
+                timestamp,
+                operation,
+                user_id,
+                workspace_name,
+                workspace_path,
+                command,
+                success,
+                duration_ms,
+            ),
+            timestamp,
+            operation,
+            success,
+        )
+
+    def _append(self, item: _Stored, timestamp: float, operation: str, success: bool) -> None:
+        if self._max_entries is not None and len(self._entries) >= self._max_entries:
+            self._evict_oldest()
+        if self._timestamps and timestamp < self._timestamps[-1]:
+            self._time_ordered = False
+
+        self._entries.append(item)
+        self._timestamps.append(timestamp)
+        by_operation = self._by_operation.get(operation)
+        if by_operation is None:
+            by_operation = self._by_operation[operation] = deque()
+        by_operation.append(item)
+        self._by_status[bool(success)].append(item)
+
+    def _evict_oldest(self) -> None:
+        oldest = self._entries.popleft()
+        self._timestamps.popleft()
+        if isinstance(oldest, tuple):
+            operation, success = oldest[1], oldest[6]
+        else:
+            operation, success = oldest.operation, oldest.success
+        self._by_operation[operation].popleft()
+        self._by_status[bool(success)].popleft()
 
     def get_entries(self) -> list[OperationLogEntry]:
         """Get all logged entries."""
-        return list(self._entries)
+        return self._materialize(self._entries)
 
     def get_entries_by_operation(
         self, operation: str
     ) -> list[OperationLogEntry]:
         """Get entries filtered by operation type."""
-        return [e for e in self._entries if e.operation == operation]
+        return self._materialize(self._by_operation.get(operation, ()))
 
     def get_entries_by_status(self, success: bool) -> list[OperationLogEntry]:
         """Get entries filtered by success status."""
-        return [e for e in self._entries if e.success is success]
+        return self._materialize(self._by_status[bool(success)])
 
     @property
     def length(self) -> int:
@@ -46,11 +146,28 @@ class ArrayOperationsLogger:
     def clear(self) -> None:
         """Clear all logged entries."""
         self._entries.clear()
+        self._timestamps.clear()
+        self._by_operation.clear()
+        for entries in self._by_status:
+            entries.clear()
+        self._time_ordered = True
+        self._has_raw = False
 
     def get_entries_in_range(
         self, start: float, end: float
     ) -> list[OperationLogEntry]:
         """Get entries within a time range (timestamps as floats)."""
-        return [
-            e for e in self._entries if start <= e.timestamp <= end
-        ]
+        if not self._time_ordered:
+            return self._materialize(
+                e
+                for e, ts in zip(self._entries, self._timestamps, strict=True)
+                if start <= ts <= end
+            )
+        lo = bisect_left(self._timestamps, start)
+        hi = bisect_right(self._timestamps, end)
+        return self._materialize(islice(self._entries, lo, hi))
+
+    def _materialize(self, items: Iterable[_Stored]) -> list[OperationLogEntry]:
+        if not self._has_raw:
+            return list(items)  # type: ignore[arg-type]
+        return [OperationLogEntry(*e) if isinstance(e, tuple) else e for e in items]
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import math
 import sys
-from datetime import UTC, datetime
+import time
 
 from agent_backend.logging.types import OperationLogEntry
 from agent_backend.types import LoggingMode
@@ -15,38 +16,65 @@ class ConsoleOperationsLogger:
     Logs workspace operations to stderr with formatted output.
     """
 
+    __slots__ = ("_cached_second", "_cached_second_str", "_mode")
+
     def __init__(self, mode: LoggingMode = LoggingMode.STANDARD) -> None:
         self._mode = mode
+        # Entries arrive in bursts within the same second; reuse its formatting
+        self._cached_second: int | None = None
+        self._cached_second_str = ""
 
     @property
     def mode(self) -> LoggingMode:
         return self._mode
 
     def log(self, entry: OperationLogEntry) -> None:
-        timestamp = datetime.fromtimestamp(entry.timestamp, tz=UTC).isoformat()
+        timestamp = self._format_timestamp(entry.timestamp)
         prefix = f"[{timestamp}] [{entry.user_id}/{entry.workspace_name}]"
         status = "\u2713" if entry.success else "\u2717"
         duration = f"{entry.duration_ms:.0f}ms"
 
-        main_line = f"{prefix} {status} {entry.operation}: {entry.command} ({duration})"
-
-        if entry.success:
-            print(main_line, file=sys.stderr)
-        else:
-            print(main_line, file=sys.stderr)
+        lines = [f"{prefix} {status} {entry.operation}: {entry.command} ({duration})"]
 
         if entry.operation == "exec":
             if entry.stdout:
-                print(f"  stdout: {self._truncate(entry.stdout, 200)}", file=sys.stderr)
+                lines.append(f"  stdout: {self._truncate(entry.stdout, 200)}")
             if entry.stderr:
-                print(f"  stderr: {self._truncate(entry.stderr, 200)}", file=sys.stderr)
+                lines.append(f"  stderr: {self._truncate(entry.stderr, 200)}")
 
         if not entry.success and entry.error:
-            print(f"  error: {entry.error}", file=sys.stderr)
+            lines.append(f"  error: {entry.error}")
+
+        # One write per entry so lines from concurrent entries don't interleave
+        lines.append("")
+        sys.stderr.write("\n".join(lines))
+
+    def _format_timestamp(self, timestamp: float) -> str:
+        """Format like ``datetime.fromtimestamp(ts, tz=UTC).isoformat()``, faster."""
+        # Same microsecond rounding as datetime.fromtimestamp
+        frac, whole = math.modf(timestamp)
+        seconds = int(whole)
+        micros = round(frac * 1e6)
+        if micros >= 1_000_000:
+            seconds += 1
+            micros -= 1_000_000
+        elif micros < 0:
+            seconds -= 1
+            micros += 1_000_000
+
+        if seconds != self._cached_second:
+            self._cached_second = seconds
+            self._cached_second_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        if micros:
+            return f"{self._cached_second_str}.{micros:06d}+00:00"
+        return f"{self._cached_second_str}+00:00"
 
     @staticmethod
     def _truncate(s: str, max_length: int) -> str:
-        single_line = s.replace("\n", "\\n")
+        # Escaping never shortens text, so the first max_length + 1 characters
+        # decide both the result and whether it was truncated; large outputs
+        # are not copied in full
+        single_line = s[: max_length + 1].replace("\n", "\\n")
         if len(single_line) <= max_length:
             return single_line
         return f"{single_line[:max_length]}..."
@@ -8,7 +8,7 @@ from typing import Protocol
 from agent_backend.types import MODIFYING_OPERATIONS, LoggingMode, OperationType
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationLogEntry:
     """Entry representing a logged operation."""
 
@@ -35,8 +35,11 @@ class OperationsLogger(Protocol):
     def log(self, entry: OperationLogEntry) -> None: ...
 
 
+_VERBOSE = LoggingMode.VERBOSE
+
+
 def should_log_operation(operation: str, mode: LoggingMode) -> bool:
     """Determine if an operation should be logged based on mode."""
-    if mode == LoggingMode.VERBOSE:
+    if mode == _VERBOSE:
         return True
     return operation in MODIFYING_OPERATIONS
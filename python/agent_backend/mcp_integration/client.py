@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import weakref
+from typing import TYPE_CHECKING, Any
 
-import httpx
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
-from mcp.client.streamable_http import streamable_http_client
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Initialized stdio sessions per owning backend, keyed by server arguments.
+# Sessions are never shared across backends: each stdio server holds its own
+# state (e.g. the memory store). Futures let concurrent callers for the same
+# key share a single in-flight spawn.
+_client_cache: weakref.WeakKeyDictionary[
+    object, dict[tuple[str, str, str | None, str | None], asyncio.Future[Any]]
+] = weakref.WeakKeyDictionary()
 
 
 async def create_mcp_client(
@@ -15,11 +23,106 @@ async def create_mcp_client(
     root_dir: str,
     isolation: str | None = None,
     shell: str | None = None,
+    *,
+    owner: object | None = None,
 ) -> Any:
     """Create an MCP client for local/memory backends.
 
-    Spawns agent-backend CLI as a subprocess.
+    Spawns agent-backend CLI as a subprocess. When ``owner`` is given, the
+    initialized session is cached for that owner, so later calls with the
+    same arguments reuse it instead of spawning another server. A session is
+    evicted once its transport stream closes (the session exited or the
+    server's output ended), so the next call spawns a fresh one.
+    """
+    if owner is None:
+        return await _spawn_mcp_client(backend_type, root_dir, isolation, shell)
+
+    loop = asyncio.get_running_loop()
+    cache = _client_cache.setdefault(owner, {})
+    key = (backend_type, root_dir, isolation, shell)
+
+    future = cache.get(key)
+    # Futures cannot cross event loops
+    if future is not None and future.get_loop() is not loop:
+        del cache[key]
+        future = None
+
+    if future is None:
+        # No await between the lookup and the insert, so this is race-free
+        future = loop.create_future()
+        cache[key] = future
+
+        def evict(future: asyncio.Future[Any] = future) -> None:
+            if cache.get(key) is future:
+                del cache[key]
+
+        try:
+            session = await _spawn_mcp_client(
+                backend_type, root_dir, isolation, shell, on_closed=evict
+            )
+        except BaseException as e:
+            evict()
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so lone failures don't log "never retrieved"
+                future.exception()
+            raise
+        future.set_result(session)
+        return session
+
+    return await asyncio.shield(future)
+
+
+class _WatchedReceiveStream:
+    """Transport receive stream that reports when it is closed.
+
+    ``ClientSession`` closes its read stream when its receive loop ends,
+    whether the session exited or the server's output reached EOF, so this
+    is the point a cached session stops being usable.
     """
+
+    def __init__(self, stream: Any, on_closed: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_closed: Callable[[], None] | None = on_closed
+
+    def _closed(self) -> None:
+        if self._on_closed is not None:
+            on_closed, self._on_closed = self._on_closed, None
+            on_closed()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+    def __aiter__(self) -> _WatchedReceiveStream:
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self._stream.__anext__()
+
+    async def __aenter__(self) -> _WatchedReceiveStream:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        self._closed()
+        self._stream.close()
+
+    async def aclose(self) -> None:
+        self._closed()
+        await self._stream.aclose()
+
+
+async def _spawn_mcp_client(
+    backend_type: str,
+    root_dir: str,
+    isolation: str | None,
+    shell: str | None,
+    on_closed: Callable[[], None] | None = None,
+) -> Any:
     if backend_type == "local":
         args = ["daemon", "--rootDir", root_dir, "--local-only"]
         if isolation:
@@ -29,9 +132,14 @@ async def create_mcp_client(
     else:
         args = ["--backend", "memory", "--rootDir", root_dir]
 
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
     server_params = StdioServerParameters(command="agent-backend", args=args)
     stdio_ctx = stdio_client(server_params)
     read_stream, write_stream = await stdio_ctx.__aenter__()
+    if on_closed is not None:
+        read_stream = _WatchedReceiveStream(read_stream, on_closed)
     session = ClientSession(read_stream, write_stream)
     await session.__aenter__()
     await session.initialize()
@@ -48,6 +156,10 @@ async def create_remote_mcp_client(
     connection_timeout_ms: int = 10000,
 ) -> Any:
     """Create an MCP client for remote backends via HTTP."""
+    import httpx
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamable_http_client
+
     headers: dict[str, str] = {"X-Root-Dir": root_dir}
     if auth_token:
         headers["Authorization"] = f"Bearer {auth_token}"
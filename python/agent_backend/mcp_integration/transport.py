@@ -8,10 +8,14 @@ Creates the appropriate MCP transport based on backend type:
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from agent_backend.types import BackendType
 
+# Seconds to wait for the server to exit after SIGTERM before killing it
+_CLOSE_TIMEOUT = 2.0
+
 
 async def create_backend_mcp_transport(
     backend: Any,
@@ -87,8 +91,17 @@ class _StdioTransportWrapper:
         self._process: Any = None
 
     async def close(self) -> None:
-        if self._process:
+        process = self._process
+        if not process:
+            return
+        try:
+            process.terminate()
+            # Reap the process so repeated transports don't leak zombies or pipes
             try:
-                self._process.terminate()
-            except Exception:
-                pass
+                await asyncio.wait_for(process.wait(), timeout=_CLOSE_TIMEOUT)
+            except TimeoutError:
+                process.kill()
+                await process.wait()
+        except Exception:
+            pass
+        self._process = None
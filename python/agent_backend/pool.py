@@ -6,6 +6,8 @@ Provides key-based pooling of backend instances for stateless servers.
 from __future__ import annotations
 
 import asyncio
+import heapq
+import inspect
 import logging
 import time
 from collections.abc import Callable
@@ -19,8 +21,15 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 R = TypeVar("R")
 
+# Enum member access goes through a descriptor on every lookup; the hot
+# acquire path compares against a module-level reference instead
+_CONNECTED = ConnectionStatus.CONNECTED
 
-@dataclass
+# Upper bound on backends torn down concurrently by destroy_all
+_DESTROY_CONCURRENCY = 32
+
+
+@dataclass(slots=True)
 class PoolManagerConfig:
     """Configuration for BackendPoolManager."""
 
@@ -31,7 +40,7 @@ class PoolManagerConfig:
     cleanup_interval_ms: int = 60 * 1000
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PoolStats:
     """Pool statistics."""
 
@@ -41,11 +50,13 @@ class PoolStats:
     backends_by_key: dict[str, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class _PooledBackend:
     backend: Any
     in_use: int = 0
     last_used: float = 0.0
+    # Whether an expiry for this entry is pending in the pool's heap
+    scheduled: bool = False
 
 
 class BackendPoolManager:
@@ -56,7 +67,13 @@ class BackendPoolManager:
 
     def __init__(self, config: PoolManagerConfig) -> None:
         self._config = config
+        self._idle_timeout_s = config.idle_timeout_ms / 1000.0
         self._backends: dict[str, _PooledBackend] = {}
+        # Pooled entries with in_use > 0, kept current so stats need no scan
+        self._active = 0
+        # (deadline, key) min-heap, at most one pending entry per idle backend,
+        # so cleanup only visits backends that may have expired
+        self._expiry_heap: list[tuple[float, str]] = []
         self._cleanup_task: asyncio.Task[None] | None = None
 
         if config.enable_periodic_cleanup:
@@ -76,25 +93,55 @@ class BackendPoolManager:
         Returns:
             Tuple of (backend, release_function).
         """
-        merged_config = {**self._config.default_config, **(config_override or {})}
+        # ** unpacking copies into fresh kwargs anyway, so only merge when
+        # there is an override to apply
+        default_config = self._config.default_config
+        merged_config = default_config | config_override if config_override else default_config
 
         if key is None:
             backend = self._config.backend_factory(**merged_config)
             return backend, lambda: None
 
+        # Everything up to the first await runs without yielding, so concurrent
+        # acquires for a key always see (and share) the entry installed here
         pooled = self._backends.get(key)
+        stale: _PooledBackend | None = None
 
-        if not pooled or pooled.backend.status != ConnectionStatus.CONNECTED:
+        if not pooled or pooled.backend.status != _CONNECTED:
+            if pooled:
+                if pooled.in_use == 0:
+                    stale = pooled
+                else:
+                    self._active -= 1
             backend = self._config.backend_factory(**merged_config)
-            pooled = _PooledBackend(backend=backend, in_use=0, last_used=time.time())
+            pooled = _PooledBackend(backend=backend, in_use=0, last_used=time.monotonic())
             self._backends[key] = pooled
 
+        # last_used only matters once idle; in_use > 0 already keeps cleanup away
         pooled.in_use += 1
-        pooled.last_used = time.time()
+        if pooled.in_use == 1:
+            self._active += 1
 
         def release() -> None:
             pooled.in_use -= 1
-            pooled.last_used = time.time()
+            # A replaced or destroyed entry no longer counts toward the pool
+            if pooled.in_use == 0 and self._backends.get(key) is pooled:
+                self._active -= 1
+                # Only the last release starts the idle clock
+                pooled.last_used = time.monotonic()
+                if not pooled.scheduled:
+                    pooled.scheduled = True
+                    heapq.heappush(
+                        self._expiry_heap, (pooled.last_used + self._idle_timeout_s, key)
+                    )
+
+        if stale:
+            # A replaced backend is no longer reachable through the pool, so
+            # idle cleanup would never destroy it
+            try:
+                await stale.backend.destroy()
+            except Exception:
+                logger.error("Error destroying stale backend for key %s", key)
 
         return pooled.backend, release
 
@@ -107,7 +154,7 @@ class BackendPoolManager:
         """Execute function with backend from pool (automatic cleanup).
 
         Args:
-            fn: Async function to execute with backend.
+            fn: Function to execute with backend; may be sync or async.
             key: Key for backend identification.
             config_override: Per-request configuration overrides.
 
@@ -116,28 +163,23 @@ class BackendPoolManager:
         """
         backend, release = await self.acquire_backend(key, config_override)
         try:
-            return await fn(backend)
+            result = fn(backend)
+            # Sync callables skip the await; lambdas returning a coroutine
+            # are not coroutine functions, so check the result
+            if inspect.isawaitable(result):
+                result = await result
+            return result
         finally:
             release()
 
     def get_stats(self) -> PoolStats:
         """Get pool statistics."""
-        active = 0
-        idle = 0
-        by_key: dict[str, int] = {}
-
-        for key, pooled in self._backends.items():
-            by_key[key] = 1
-            if pooled.in_use > 0:
-                active += 1
-            else:
-                idle += 1
-
+        total = len(self._backends)
         return PoolStats(
-            total_backends=len(self._backends),
-            active_backends=active,
-            idle_backends=idle,
-            backends_by_key=by_key,
+            total_backends=total,
+            active_backends=self._active,
+            idle_backends=total - self._active,
+            backends_by_key=dict.fromkeys(self._backends, 1),
         )
 
     async def destroy_all(self) -> None:
@@ -146,12 +188,27 @@ class BackendPoolManager:
             self._cleanup_task.cancel()
             self._cleanup_task = None
 
-        for key, pooled in list(self._backends.items()):
+        # Teardowns are independent I/O, so run them concurrently, bounded so
+        # a large pool does not open a burst of connections at once
+        semaphore = asyncio.Semaphore(_DESTROY_CONCURRENCY)
+        async with asyncio.TaskGroup() as tg:
+            for key, pooled in list(self._backends.items()):
+                tg.create_task(self._safe_destroy(key, pooled, semaphore))
+        self._expiry_heap.clear()
+
+    async def _safe_destroy(
+        self, key: str, pooled: _PooledBackend, semaphore: asyncio.Semaphore
+    ) -> None:
+        """Destroy a pooled backend and drop it from the pool, logging failures."""
+        async with semaphore:
             try:
                 await pooled.backend.destroy()
             except Exception:
                 logger.error("Error destroying backend for key %s", key)
+        if self._backends.get(key) is pooled:
             del self._backends[key]
+            if pooled.in_use > 0:
+                self._active -= 1
 
     def _start_periodic_cleanup(self) -> None:
         """Start periodic cleanup of idle backends."""
@@ -164,18 +221,31 @@ class BackendPoolManager:
 
     async def _cleanup_idle_backends(self) -> None:
         """Cleanup idle backends that exceed timeout."""
-        now = time.time()
-        timeout_s = self._config.idle_timeout_ms / 1000.0
-
-        to_cleanup: list[str] = []
-        for key, pooled in self._backends.items():
-            if pooled.in_use == 0 and (now - pooled.last_used) > timeout_s:
-                to_cleanup.append(key)
+        heap = self._expiry_heap
+        now = time.monotonic()
+        # Steady state: nothing has expired, so skip the bookkeeping entirely
+        if not heap or heap[0][0] >= now:
+            return
+
+        timeout_s = self._idle_timeout_s
+        to_cleanup: list[tuple[str, _PooledBackend]] = []
+        while heap and heap[0][0] < now:
+            _, key = heapq.heappop(heap)
+            pooled = self._backends.get(key)
+            if pooled is None:
+                continue
+            if pooled.in_use > 0:
+                # Back in use; the next release schedules a fresh expiry
+                pooled.scheduled = False
+            elif (now - pooled.last_used) > timeout_s:
+                del self._backends[key]
+                to_cleanup.append((key, pooled))
+            else:
+                # Used again since this entry was pushed
+                heapq.heappush(heap, (pooled.last_used + timeout_s, key))
 
-        for key in to_cleanup:
-            pooled = self._backends.pop(key, None)
-            if pooled:
-                try:
-                    await pooled.backend.destroy()
-                except Exception:
-                    logger.error("Error destroying idle backend for key %s", key)
+        for key, pooled in to_cleanup:
+            try:
+                await pooled.backend.destroy()
+            except Exception:
+                logger.error("Error destroying idle backend for key %s", key)
@@ -7,21 +7,28 @@ Implements heredoc stripping and allowed pattern overrides.
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 
 # Default patterns that are allowed even though they might match dangerous patterns
-DEFAULT_ALLOWED_PATTERNS: list[re.Pattern[str]] = [
+DEFAULT_ALLOWED_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(r"^gcloud\s+.*\brsync\b"),
     re.compile(r"^gcloud\s+storage\s+rsync\b"),
-]
+)
 
 # Dangerous command patterns
-DANGEROUS_PATTERNS: list[re.Pattern[str]] = [
-    # System-wide destructive rm operations
-    re.compile(r"\brm\b.*-rf?\b.*[/~*]"),
-    re.compile(r"\brm\b.*[/~*].*-rf?\b"),
+DANGEROUS_PATTERNS: tuple[re.Pattern[str], ...] = (
+    # System-wide destructive rm operations. These (and dd below) match
+    # "X, later Y, later Z" within a line, which holds iff it holds from the
+    # first X and then the first Y. Anchoring at the line start and committing
+    # to those with atomic groups keeps the search linear; the unanchored
+    # forms backtracked cubically on inputs like "rm -r rm -r ...".
+    re.compile(r"^(?>.*?\brm\b)(?>.*?-rf?\b).*[/~*]", re.MULTILINE),
+    re.compile(r"^(?>.*?\brm\b)(?>.*?[/~*]).*-rf?\b", re.MULTILINE),
     # Disk wiping with dd
-    re.compile(r"\bdd\b.*\bof=/dev/"),
+    re.compile(r"^(?>.*?\bdd\b).*\bof=/dev/", re.MULTILINE),
     # Privilege escalation
     re.compile(r"\bsudo\b"),
     re.compile(r"\bsu\b"),
@@ -80,10 +87,10 @@ DANGEROUS_PATTERNS: list[re.Pattern[str]] = [
     re.compile(r"\b(cp|mv|ln)\b.*\.\./"),
     # Symbolic link creation that could escape
     re.compile(r"\bln\s+-s"),
-]
+)
 
 # Patterns for workspace escape attempts
-ESCAPE_PATTERNS: list[re.Pattern[str]] = [
+ESCAPE_PATTERNS: tuple[re.Pattern[str], ...] = (
     # Change directory commands
     re.compile(r"\bcd\b"),
     re.compile(r"\bpushd\b"),
@@ -101,7 +108,50 @@ ESCAPE_PATTERNS: list[re.Pattern[str]] = [
     # Command substitution
     re.compile(r"\$\([^)]+\)"),
     re.compile(r"`[^`]+`"),
-]
+)
+
+# A literal each pattern cannot match without, aligned by index with
+# DANGEROUS_PATTERNS (matched against the lowercased command) and
+# ESCAPE_PATTERNS. A pattern is only searched when its literal is present,
+# and most commands contain none, so they skip the regex engine entirely.
+_DANGEROUS_LITERALS: tuple[str, ...] = (
+    "rm", "rm", "of=/dev/", "sudo", "su", "doas", "chmod", "chown",
+    "curl", "wget", "|", "nc", "ncat", "netcat", "telnet", "ftp",
+    "ssh", "scp", "rsync", "kill", "killall", "pkill", "shutdown", "reboot",
+    "halt", "init", "mount", "umount", "fdisk", "mkfs", "fsck", "`",
+    "$(", "eval", ":()", "fork()", "while", "/dev/null", "iptables", "ifconfig",
+    "/etc/", "/etc/", "/etc/", "/etc/", '""', "../", "ln",
+)  # fmt: skip
+_ESCAPE_LITERALS: tuple[str, ...] = (
+    "cd", "pushd", "popd", "PATH=", "HOME=", "PWD=",
+    "~/", "$HOME", "${HOME}", "..", "$(", "`",
+)  # fmt: skip
+
+
+def _group_by_literal(literals: tuple[str, ...]) -> tuple[tuple[str, tuple[int, ...]], ...]:
+    """Map each distinct literal to the indices of the patterns it gates."""
+    groups: dict[str, list[int]] = {}
+    for i, literal in enumerate(literals):
+        groups.setdefault(literal, []).append(i)
+    return tuple((literal, tuple(ids)) for literal, ids in groups.items())
+
+
+_DANGEROUS_TRIGGERS = _group_by_literal(_DANGEROUS_LITERALS)
+_ESCAPE_TRIGGERS = _group_by_literal(_ESCAPE_LITERALS)
+
+
+def _indices(patterns: tuple[re.Pattern[str], ...], *sources: str) -> frozenset[int]:
+    return frozenset(i for i, p in enumerate(patterns) if p.pattern in sources)
+
+
+# Pattern indices that map to a specific is_command_safe reason
+_PIPE_TO_SHELL_IDS = _indices(
+    DANGEROUS_PATTERNS, r"curl\b.*\|\s*(sh|bash|zsh|fish)\b", r"wget\b.*\|\s*(sh|bash|zsh|fish)\b"
+)
+
+# The delimiter is matched possessively: backtracking into shorter prefixes
+# of it only multiplied the scans for unterminated heredocs
+_HEREDOC_RE = re.compile(r"<<\s*['\"]?(\w++)['\"]?[\s\S]*?\n\1", re.MULTILINE)
 
 
 @dataclass
@@ -111,7 +161,7 @@ class SafetyConfig:
     allowed_patterns: list[re.Pattern[str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SafetyResult:
     """Result of a safety check."""
 
@@ -119,38 +169,132 @@ class SafetyResult:
     reason: str = ""
 
 
-def _is_allowed(command: str, config: SafetyConfig | None = None) -> bool:
-    """Check if a command matches any allowed pattern."""
-    normalized = command.strip()
-    all_allowed = DEFAULT_ALLOWED_PATTERNS + (config.allowed_patterns if config else [])
-    return any(pattern.search(normalized) for pattern in all_allowed)
+# Results are immutable, so the fixed outcomes are built once and shared
+_SAFE_RESULT = SafetyResult(safe=True)
+_PIPE_TO_SHELL_RESULT = SafetyResult(
+    safe=False,
+    reason=(
+        "Piping downloads to shell is dangerous. Download to a file first "
+        "(e.g., 'curl -O <url>'), inspect it, then execute if safe."
+    ),
+)
+_ESCAPE_RESULT = SafetyResult(safe=False, reason="Command attempts to escape workspace")
+# Specific escape reasons, in the order they take precedence
+_ESCAPE_REASONS: tuple[tuple[frozenset[int], SafetyResult], ...] = (
+    (
+        _indices(ESCAPE_PATTERNS, r"\bcd\b"),
+        SafetyResult(safe=False, reason="Directory change commands are not allowed"),
+    ),
+    (
+        _indices(ESCAPE_PATTERNS, r"~/", r"\$HOME"),
+        SafetyResult(safe=False, reason="Home directory references are not allowed"),
+    ),
+    (
+        _indices(ESCAPE_PATTERNS, r"\.\.[/\\]"),
+        SafetyResult(safe=False, reason="Parent directory traversal is not allowed"),
+    ),
+)
+
+
+@dataclass(slots=True)
+class _ParsedCommand:
+    """The normalized forms of a command, computed once per check."""
+
+    raw: str
+    stripped: str
+    lowered: str
+
+    @classmethod
+    def parse(cls, command: str) -> _ParsedCommand:
+        stripped = command.strip()
+        return cls(command, stripped, stripped.lower())
+
+    @property
+    def base(self) -> str:
+        return get_base_command(self.stripped)
+
+
+def _is_allowed(stripped: str, allowed: tuple[re.Pattern[str], ...] = ()) -> bool:
+    """Check if a stripped command matches a default or configured allowed pattern."""
+    patterns = chain(DEFAULT_ALLOWED_PATTERNS, allowed) if allowed else DEFAULT_ALLOWED_PATTERNS
+    return any(pattern.search(stripped) for pattern in patterns)
+
+
+# Agents repeat a small vocabulary of commands, so verdicts are memoized per
+# (command, allowed patterns). Long commands (heredocs carrying file
+# contents) are rarely repeated and would pin memory, so they bypass the cache.
+_CACHE_MAX_COMMAND_LENGTH = 4096
+
+
+def _allowed_key(config: SafetyConfig | None) -> tuple[re.Pattern[str], ...]:
+    return tuple(config.allowed_patterns) if config and config.allowed_patterns else ()
 
 
 def is_dangerous(command: str, config: SafetyConfig | None = None) -> bool:
     """Check if a command contains dangerous operations."""
-    normalized = command.strip().lower()
+    if len(command) > _CACHE_MAX_COMMAND_LENGTH:
+        return _is_dangerous(command, _allowed_key(config))
+    return _is_dangerous_cached(command, _allowed_key(config))
+
 
-    if _is_allowed(command, config):
+def _is_dangerous(command: str, allowed: tuple[re.Pattern[str], ...]) -> bool:
+    parsed = _ParsedCommand.parse(command)
+
+    if _is_allowed(parsed.stripped, allowed):
         return False
 
-    return any(pattern.search(normalized) for pattern in DANGEROUS_PATTERNS)
+    # Lowercasing is what lets the lowercase trigger literals gate the search
+    return _any_match(DANGEROUS_PATTERNS, _DANGEROUS_TRIGGERS, parsed.lowered)
+
+
+_is_dangerous_cached = lru_cache(maxsize=1024)(_is_dangerous)
+
+
+def _any_match(
+    patterns: tuple[re.Pattern[str], ...],
+    triggers: tuple[tuple[str, tuple[int, ...]], ...],
+    text: str,
+) -> bool:
+    """Whether any pattern whose trigger literal occurs in ``text`` matches it."""
+    for literal, ids in triggers:
+        if literal in text:
+            for i in ids:
+                if patterns[i].search(text):
+                    return True
+    return False
+
+
+def _matched_ids(
+    patterns: tuple[re.Pattern[str], ...],
+    triggers: tuple[tuple[str, tuple[int, ...]], ...],
+    text: str,
+) -> frozenset[int]:
+    """Indices of the patterns that match ``text``, searching only triggered ones."""
+    return frozenset(
+        i
+        for literal, ids in triggers
+        if literal in text
+        for i in ids
+        if patterns[i].search(text)
+    )
 
 
 def _strip_heredoc_content(command: str) -> str:
     """Strip heredoc content from command to prevent false positives."""
-    heredoc_regex = re.compile(r"<<\s*['\"]?(\w+)['\"]?[\s\S]*?\n\1", re.MULTILINE)
-    return heredoc_regex.sub("<<HEREDOC_PLACEHOLDER", command)
+    if "<<" not in command:
+        return command
+    return _HEREDOC_RE.sub("<<HEREDOC_PLACEHOLDER", command)
 
 
 def is_escaping_workspace(command: str) -> bool:
     """Check if a command attempts to escape the workspace."""
     command_without_heredocs = _strip_heredoc_content(command)
-    return any(pattern.search(command_without_heredocs) for pattern in ESCAPE_PATTERNS)
+    return _any_match(ESCAPE_PATTERNS, _ESCAPE_TRIGGERS, command_without_heredocs)
 
 
 def get_base_command(command: str) -> str:
     """Extract the base command from a command string."""
-    parts = command.strip().split()
+    parts = command.split(None, 1)
     return parts[0] if parts else ""
 
 
@@ -159,41 +303,57 @@ def is_command_safe(command: str, config: SafetyConfig | None = None) -> SafetyR
 
     Combines dangerous command checking and workspace escape detection.
     """
-    if is_dangerous(command, config):
-        base_cmd = get_base_command(command)
+    if len(command) > _CACHE_MAX_COMMAND_LENGTH:
+        return _is_command_safe(command, _allowed_key(config))
+    return _is_command_safe_cached(command, _allowed_key(config))
+
+
+def _is_command_safe(command: str, allowed: tuple[re.Pattern[str], ...]) -> SafetyResult:
+    parsed = _ParsedCommand.parse(command)
+    dangerous_ids = (
+        frozenset()
+        if _is_allowed(parsed.stripped, allowed)
+        else _matched_ids(DANGEROUS_PATTERNS, _DANGEROUS_TRIGGERS, parsed.lowered)
+    )
+    if dangerous_ids:
+        base_cmd = parsed.base
 
         # Specific guidance for pipe-to-shell
-        if re.search(
-            r"(?:curl|wget)\b.*\|\s*(?:sh|bash|zsh|fish)\b", command.lower()
-        ):
-            return SafetyResult(
-                safe=False,
-                reason=(
-                    "Piping downloads to shell is dangerous. Download to a file first "
-                    "(e.g., 'curl -O <url>'), inspect it, then execute if safe."
-                ),
-            )
+        if dangerous_ids & _PIPE_TO_SHELL_IDS:
+            return _PIPE_TO_SHELL_RESULT
 
         return SafetyResult(
             safe=False,
             reason=f"dangerous command '{base_cmd}' is not allowed",
         )
 
-    if is_escaping_workspace(command):
-        if re.search(r"\bcd\b", command):
-            return SafetyResult(
-                safe=False, reason="Directory change commands are not allowed"
-            )
-        if re.search(r"~/", command) or re.search(r"\$HOME", command):
-            return SafetyResult(
-                safe=False, reason="Home directory references are not allowed"
-            )
-        if re.search(r"\.\.[/\\]", command):
-            return SafetyResult(
-                safe=False, reason="Parent directory traversal is not allowed"
-            )
-        return SafetyResult(
-            safe=False, reason="Command attempts to escape workspace"
-        )
+    # The reason is chosen from the same heredoc-stripped text that decided
+    # the verdict, so text inside a heredoc body never picks the reason
+    escape_ids = _matched_ids(ESCAPE_PATTERNS, _ESCAPE_TRIGGERS, _strip_heredoc_content(parsed.raw))
+    if escape_ids:
+        for ids, result in _ESCAPE_REASONS:
+            if escape_ids & ids:
+                return result
+        return _ESCAPE_RESULT
+
+    return _SAFE_RESULT
 
-    return SafetyResult(safe=True)
+
+_is_command_safe_cached = lru_cache(maxsize=1024)(_is_command_safe)
+
+
+def is_command_safe_batch(
+    commands: Iterable[str], config: SafetyConfig | None = None
+) -> list[SafetyResult]:
+    """Check several commands at once, in order.
+
+    Equivalent to calling :func:`is_command_safe` on each command, but the
+    allowed-pattern key is built once for the whole batch.
+    """
+    allowed = _allowed_key(config)
+    return [
+        _is_command_safe(command, allowed)
+        if len(command) > _CACHE_MAX_COMMAND_LENGTH
+        else _is_command_safe_cached(command, allowed)
+        for command in commands
+    ]
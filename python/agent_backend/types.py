@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 
 class ErrorCode(StrEnum):
@@ -115,7 +118,7 @@ class NotImplementedBackendError(BackendError):
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StatusChangeEvent:
     """Event emitted when connection status changes."""
 
@@ -125,7 +128,7 @@ class StatusChangeEvent:
     error: Exception | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileStat:
     """File metadata information."""
 
@@ -135,7 +138,7 @@ class FileStat:
     modified: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ReconnectionConfig:
     """Configuration for automatic reconnection."""
 
@@ -146,7 +149,7 @@ class ReconnectionConfig:
     backoff_multiplier: float = 2.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ScopeConfig:
     """Configuration for creating a scoped backend."""
 
@@ -154,23 +157,23 @@ class ScopeConfig:
     operations_logger: object | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecOptions:
     """Options for exec command."""
 
     encoding: Literal["utf8", "buffer"] = "utf8"
     cwd: str | None = None
-    env: dict[str, str] | None = None
+    env: Mapping[str, str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReadOptions:
     """Options for read command."""
 
     encoding: Literal["utf8", "buffer"] = "utf8"
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalFilesystemBackendConfig:
     """Configuration for LocalFilesystemBackend."""
 
@@ -181,9 +184,10 @@ class LocalFilesystemBackendConfig:
     max_output_length: int | None = None
     shell: ShellPreference = ShellPreference.AUTO
     validate_utils: bool = False
+    shell_pool_size: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoteFilesystemBackendConfig:
     """Configuration for RemoteFilesystemBackend."""
 
@@ -200,9 +204,10 @@ class RemoteFilesystemBackendConfig:
     isolation: IsolationMode = IsolationMode.AUTO
     prevent_dangerous: bool = True
     max_output_length: int | None = None
+    sftp_pool_size: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryBackendConfig:
     """Configuration for MemoryBackend."""
 
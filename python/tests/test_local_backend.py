@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 
 import pytest
@@ -62,6 +63,52 @@ class TestLocalBackendFileOps:
         result = await local_backend.read("buf.txt", ReadOptions(encoding="buffer"))
         assert result == b"hello"
 
+    async def test_read_stream(self, local_backend):
+        content = bytes(range(256)) * 1000
+        await local_backend.write("big.bin", content)
+        chunks = [chunk async for chunk in local_backend.read_stream("big.bin", 4096)]
+        assert all(len(chunk) <= 4096 for chunk in chunks)
+        assert b"".join(chunks) == content
+
+    async def test_read_stream_closes_fd_on_pool_when_abandoned(self, local_backend, monkeypatch):
+        from agent_backend.backends import local as local_module
+
+        await local_backend.write("big.bin", b"x" * 10_000)
+        real_run_io = local_module.run_io
+        calls = []
+
+        async def run_io(fn, *args, **kwargs):
+            calls.append(fn)
+            return await real_run_io(fn, *args, **kwargs)
+
+        monkeypatch.setattr(local_module, "run_io", run_io)
+        stream = local_backend.read_stream("big.bin", 4096)
+        assert len(await anext(stream)) == 4096
+        await stream.aclose()
+        assert calls == [os.open, os.read, os.close]
+
+    async def test_read_stream_nonexistent(self, local_backend):
+        with pytest.raises(BackendError) as exc_info:
+            async for _ in local_backend.read_stream("nonexistent.txt"):
+                pass
+        assert exc_info.value.code == ErrorCode.READ_FAILED
+
+    async def test_read_translates_newlines(self, local_backend):
+        await local_backend.write("crlf.txt", b"a\r\nb\rc\n")
+        assert await local_backend.read("crlf.txt") == "a\nb\nc\n"
+        raw = await local_backend.read("crlf.txt", ReadOptions(encoding="buffer"))
+        assert raw == b"a\r\nb\rc\n"
+
+    async def test_read_empty_file(self, local_backend):
+        await local_backend.write("empty.txt", "")
+        assert await local_backend.read("empty.txt") == ""
+
+    async def test_read_directory_fails(self, local_backend):
+        await local_backend.mkdir("a_dir")
+        with pytest.raises(BackendError) as exc_info:
+            await local_backend.read("a_dir")
+        assert exc_info.value.code == ErrorCode.READ_FAILED
+
     async def test_rename(self, local_backend):
         await local_backend.write("old.txt", "content")
         await local_backend.rename("old.txt", "new.txt")
@@ -105,6 +152,42 @@ class TestLocalBackendFileOps:
             await local_backend.readdir("nonexistent_dir")
         assert exc_info.value.code == ErrorCode.LS_FAILED
 
+    async def test_readdir_sorted(self, local_backend):
+        for name in ("c.txt", "a.txt", "b.txt"):
+            await local_backend.write(name, name)
+        assert await local_backend.readdir(".") == ["a.txt", "b.txt", "c.txt"]
+
+    async def test_readdir_stat(self, local_backend):
+        await local_backend.write("b.txt", "hello")
+        await local_backend.mkdir("a_dir")
+        entries = await local_backend.readdir_stat(".")
+        assert [name for name, _ in entries] == ["a_dir", "b.txt"]
+        dir_stat, file_stat = entries[0][1], entries[1][1]
+        assert dir_stat.is_directory and not dir_stat.is_file
+        assert file_stat.is_file and file_stat.size == 5
+
+    async def test_readdir_stat_nonexistent(self, local_backend):
+        with pytest.raises(BackendError) as exc_info:
+            await local_backend.readdir_stat("nonexistent_dir")
+        assert exc_info.value.code == ErrorCode.LS_FAILED
+
+    async def test_walk(self, local_backend, tmp_workspace):
+        await local_backend.write("top.txt", "t")
+        await local_backend.write("sub/inner.txt", "inner")
+        await local_backend.mkdir("sub/empty")
+        os.symlink(os.path.join(tmp_workspace, "sub"), os.path.join(tmp_workspace, "link"))
+        entries = dict(await local_backend.walk("."))
+        assert sorted(entries) == ["link", "sub", "sub/empty", "sub/inner.txt", "top.txt"]
+        assert entries["sub"].is_directory
+        assert entries["sub/inner.txt"].size == 5
+        # Symlinked directories are reported but not descended into
+        assert entries["link"].is_directory
+
+    async def test_walk_subdir(self, local_backend):
+        await local_backend.write("sub/a/b.txt", "b")
+        entries = await local_backend.walk("sub")
+        assert [path for path, _ in entries] == ["a", "a/b.txt"]
+
     async def test_mkdir(self, local_backend):
         await local_backend.mkdir("new_dir/sub")
         assert await local_backend.exists("new_dir/sub")
@@ -136,6 +219,65 @@ class TestLocalBackendFileOps:
             await local_backend.stat("nope.txt")
         assert exc_info.value.code == ErrorCode.READ_FAILED
 
+    async def test_stat_reflects_backend_writes(self, local_backend):
+        await local_backend.write("cached.txt", "a")
+        assert (await local_backend.stat("cached.txt")).size == 1
+        await local_backend.write("cached.txt", "abc")
+        assert (await local_backend.stat("cached.txt")).size == 3
+        await local_backend.rm("cached.txt")
+        assert not await local_backend.exists("cached.txt")
+
+    async def test_stat_reflects_exec_changes(self, local_backend):
+        await local_backend.write("cached.txt", "a")
+        await local_backend.stat("cached.txt")
+        await local_backend.exec("printf abcd > cached.txt")
+        assert (await local_backend.stat("cached.txt")).size == 4
+
+    async def test_stat_during_exec_not_cached(self, local_backend):
+        await local_backend.write("cached.txt", "a")
+
+        async def stat_mid_exec():
+            await asyncio.sleep(0.01)
+            return await local_backend.stat("cached.txt")
+
+        _, during = await asyncio.gather(
+            local_backend.exec("sleep 0.05; printf abcd > cached.txt"), stat_mid_exec()
+        )
+        assert during.size == 1
+        assert (await local_backend.stat("cached.txt")).size == 4
+
+    async def test_stat_in_flight_during_write_not_cached(self, local_backend, monkeypatch):
+        from agent_backend.backends import local as local_module
+
+        await local_backend.write("cached.txt", "a")
+        real_run_io = local_module.run_io
+        stat_read, write_done = asyncio.Event(), asyncio.Event()
+
+        async def run_io(fn, *args, **kwargs):
+            result = await real_run_io(fn, *args, **kwargs)
+            if fn is os.stat:
+                stat_read.set()
+                await write_done.wait()
+            return result
+
+        monkeypatch.setattr(local_module, "run_io", run_io)
+        stat_task = asyncio.create_task(local_backend.stat("cached.txt"))
+        await stat_read.wait()
+        await local_backend.write("cached.txt", "abc")
+        write_done.set()
+        assert (await stat_task).size == 1
+        stat_read.clear()
+        write_done.set()
+        assert (await local_backend.stat("cached.txt")).size == 3
+
+    async def test_invalidate_stat(self, local_backend, tmp_workspace):
+        await local_backend.write("cached.txt", "a")
+        await local_backend.stat("cached.txt")
+        with open(os.path.join(tmp_workspace, "cached.txt"), "w") as f:
+            f.write("abcdef")
+        local_backend.invalidate_stat("cached.txt")
+        assert (await local_backend.stat("cached.txt")).size == 6
+
 
 class TestLocalBackendPathValidation:
     async def test_path_escape_rejected(self, local_backend):
@@ -186,6 +328,19 @@ class TestLocalBackendExec:
         assert isinstance(result, str)
         assert "truncated" in result.lower() or len(result) <= 60
 
+    async def test_exec_output_truncation_counts_characters(self, tmp_workspace):
+        config = LocalFilesystemBackendConfig(
+            root_dir=tmp_workspace,
+            max_output_length=100,
+        )
+        backend = LocalFilesystemBackend(config)
+        result = await backend.exec("printf '  %0.sx' {1..300}")
+        assert result.startswith("x  x")
+        assert "Full output was 898 characters, showing first 50]" in result
+        result = await backend.exec("printf '%0.s\u00e9' {1..200}")
+        assert result.startswith("\u00e9" * 50 + "\n")
+        assert "Full output was 200 characters, showing first 50]" in result
+
     async def test_exec_sets_cwd(self, local_backend, tmp_workspace):
         result = await local_backend.exec("pwd")
         assert os.path.abspath(result) == os.path.abspath(tmp_workspace)
@@ -195,6 +350,10 @@ class TestLocalBackendExec:
         result = await local_backend.exec("echo $MY_VAR", options)
         assert result == "hello"
 
+    async def test_exec_custom_env_does_not_leak(self, local_backend):
+        await local_backend.exec("true", ExecOptions(env={"MY_VAR": "hello"}))
+        assert await local_backend.exec("echo ${MY_VAR:-unset}") == "unset"
+
     async def test_exec_with_buffer_encoding(self, local_backend):
         options = ExecOptions(encoding="buffer")
         result = await local_backend.exec("echo hello", options)
@@ -228,6 +387,106 @@ class TestLocalBackendExec:
         assert exc_info.value.code == ErrorCode.UNSAFE_COMMAND
 
 
+class TestLocalBackendShellPool:
+    @pytest.fixture
+    async def pooled_backend(self, tmp_workspace):
+        config = LocalFilesystemBackendConfig(
+            root_dir=tmp_workspace,
+            isolation=IsolationMode.SOFTWARE,
+            shell_pool_size=2,
+        )
+        backend = LocalFilesystemBackend(config)
+        yield backend
+        await backend.destroy()
+
+    async def test_exec_simple(self, pooled_backend):
+        assert await pooled_backend.exec("echo hello") == "hello"
+        assert await pooled_backend.exec("echo again") == "again"
+
+    async def test_exec_nonzero_exit(self, pooled_backend):
+        with pytest.raises(BackendError) as exc_info:
+            await pooled_backend.exec("echo oops >&2; exit 3")
+        assert exc_info.value.code == ErrorCode.EXEC_FAILED
+        assert "exit code 3" in str(exc_info.value)
+        assert "oops" in str(exc_info.value)
+        # The worker survives a failing command
+        assert await pooled_backend.exec("echo ok") == "ok"
+
+    async def test_exec_sets_cwd(self, pooled_backend, tmp_workspace):
+        result = await pooled_backend.exec("pwd")
+        assert os.path.abspath(result) == os.path.abspath(tmp_workspace)
+
+    async def test_state_does_not_leak_between_commands(self, pooled_backend):
+        await pooled_backend.exec("LEAK=1; export LEAK2=1")
+        result = await pooled_backend.exec("echo ${LEAK:-unset} ${LEAK2:-unset}")
+        assert result == "unset unset"
+
+    async def test_background_output_stays_with_its_command(self, pooled_backend):
+        first = await pooled_backend.exec("(sleep 0.2; echo late; echo err >&2) & echo first")
+        assert first == "first\nlate"
+        assert await pooled_backend.exec("echo next") == "next"
+
+    async def test_large_output_and_stderr(self, pooled_backend):
+        result = await pooled_backend.exec("head -c 300000 /dev/zero | tr '\\0' x; echo e >&2")
+        assert result == "x" * 300000
+        with pytest.raises(BackendError) as exc_info:
+            await pooled_backend.exec("cat missing-file")
+        assert "missing-file" in str(exc_info.value)
+
+    async def test_destroy_removes_worker_fifos(self, pooled_backend):
+        await pooled_backend.exec("true")
+        io_root = pooled_backend._shell_pool._io_root
+        assert os.listdir(io_root)
+        await pooled_backend.destroy()
+        assert not os.path.exists(io_root)
+
+    async def test_exec_buffer_encoding(self, pooled_backend):
+        options = ExecOptions(encoding="buffer")
+        assert await pooled_backend.exec("echo hello", options) == b"hello\n"
+
+    async def test_custom_env_bypasses_pool(self, pooled_backend):
+        options = ExecOptions(env={"MY_VAR": "hello"})
+        assert await pooled_backend.exec("echo $MY_VAR", options) == "hello"
+
+
+class TestLocalBackendIoPool:
+    def test_pool_is_shared(self):
+        from agent_backend.backends._io_pool import get_io_pool
+
+        assert get_io_pool() is get_io_pool()
+
+    def test_pool_size_from_env(self, monkeypatch):
+        from agent_backend.backends import _io_pool
+
+        monkeypatch.setattr(_io_pool, "_pool", None)
+        monkeypatch.setenv("AGENTBE_IO_THREADS", "3")
+        pool = _io_pool.get_io_pool()
+        try:
+            assert pool._max_workers == 3
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.parametrize("configured", ["auto", "4.5", "four"])
+    def test_invalid_pool_size_falls_back_to_default(self, monkeypatch, caplog, configured):
+        from agent_backend.backends import _io_pool
+
+        monkeypatch.delenv("AGENTBE_IO_THREADS", raising=False)
+        default = _io_pool._default_workers()
+        monkeypatch.setenv("AGENTBE_IO_THREADS", configured)
+        assert _io_pool._default_workers() == default
+        assert "AGENTBE_IO_THREADS" in caplog.text
+
+    async def test_file_ops_run_on_pool_threads(self, local_backend):
+        import threading
+
+        from agent_backend.backends._io_pool import run_io
+
+        name = await run_io(lambda: threading.current_thread().name)
+        assert name.startswith("agentbe-io")
+        await local_backend.write("pooled.txt", "ok")
+        assert await local_backend.read("pooled.txt") == "ok"
+
+
 class TestLocalBackendLifecycle:
     async def test_destroy(self, local_backend):
         await local_backend.destroy()
@@ -248,6 +507,30 @@ class TestLocalBackendLifecycle:
         scopes = await local_backend.list_active_scopes()
         assert "sub" not in scopes
 
+    async def test_dropped_scope_is_untracked(self, local_backend):
+        import gc
+
+        local_backend.scope("transient")
+        gc.collect()
+        assert "transient" not in await local_backend.list_active_scopes()
+
+    async def test_destroy_closes_closeables_added_during_close(self, local_backend):
+        closed = []
+
+        class ChainedCloseable:
+            def __init__(self, name, follow_up=None):
+                self.name = name
+                self.follow_up = follow_up
+
+            async def close(self):
+                closed.append(self.name)
+                if self.follow_up:
+                    local_backend.track_closeable(self.follow_up)
+
+        local_backend.track_closeable(ChainedCloseable("first", ChainedCloseable("second")))
+        await local_backend.destroy()
+        assert closed == ["first", "second"]
+
     async def test_track_closeable(self, local_backend):
         class FakeCloseable:
             closed = False
@@ -279,3 +562,40 @@ class TestLocalBackendIsolation:
         )
         backend = LocalFilesystemBackend(config)
         assert backend._actual_isolation == IsolationMode.SOFTWARE
+
+    def test_which_lookups_cached_across_instances(self, tmp_workspace, monkeypatch):
+        from agent_backend.backends import local
+
+        calls = []
+
+        def fake_which(name):
+            calls.append(name)
+            return None
+
+        local._which_cached.cache_clear()
+        monkeypatch.setattr(local.shutil, "which", fake_which)
+        try:
+            for _ in range(3):
+                backend = LocalFilesystemBackend(
+                    LocalFilesystemBackendConfig(root_dir=tmp_workspace)
+                )
+                assert backend._actual_isolation == IsolationMode.SOFTWARE
+                assert backend._shell_bin == "sh"
+            assert sorted(calls) == ["bash", "bwrap"]
+        finally:
+            local._which_cached.cache_clear()
+
+    def test_bwrap_argv(self, tmp_workspace):
+        config = LocalFilesystemBackendConfig(
+            root_dir=tmp_workspace,
+            isolation=IsolationMode.SOFTWARE,
+        )
+        backend = LocalFilesystemBackend(config)
+        argv = backend._bwrap_argv("/tmp/agentbe-workspace/sub")
+        assert argv[0] == "bwrap"
+        assert argv[-1] == "--"
+        bind = argv.index("--bind")
+        assert argv[bind + 1 : bind + 3] == [backend.root_dir, "/tmp/agentbe-workspace"]
+        chdir = argv.index("--chdir")
+        assert argv[chdir + 1] == "/tmp/agentbe-workspace/sub"
+        assert "--unshare-all" in argv
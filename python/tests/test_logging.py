@@ -2,13 +2,30 @@
 
 from __future__ import annotations
 
+import io
+import itertools
+import sys
 import time
 
+import pytest
+
 from agent_backend.logging.array import ArrayOperationsLogger
 from agent_backend.logging.console import ConsoleOperationsLogger
 from agent_backend.logging.types import OperationLogEntry, should_log_operation
 from agent_backend.types import LoggingMode, OperationType
 
+# Deterministic, strictly increasing timestamps; no clock read per entry
+_next_timestamp = map(float, itertools.count(1)).__next__
+
+
+def capture_stderr(monkeypatch: pytest.MonkeyPatch) -> io.StringIO:
+    # ConsoleOperationsLogger writes through sys.stderr, so swapping the object
+    # is enough; no file-descriptor capture needed. Call from the test body:
+    # pytest reinstalls its own capture between setup and call.
+    buf = io.StringIO()
+    monkeypatch.setattr(sys, "stderr", buf)
+    return buf
+
 
 def make_entry(
     operation: OperationType = "exec",
@@ -17,7 +34,7 @@ def make_entry(
     error: str | None = None,
 ) -> OperationLogEntry:
     return OperationLogEntry(
-        timestamp=time.time(),
+        timestamp=_next_timestamp(),
         operation=operation,
         user_id="test-user",
         workspace_name="test-ws",
@@ -30,6 +47,14 @@ def make_entry(
     )
 
 
+class TestOperationLogEntry:
+    def test_uses_slots(self):
+        entry = make_entry()
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.extra = 1  # type: ignore[attr-defined]
+
+
 class TestArrayOperationsLogger:
     def test_log_and_retrieve(self):
         logger = ArrayOperationsLogger()
@@ -65,27 +90,152 @@ class TestArrayOperationsLogger:
         assert ArrayOperationsLogger().mode == LoggingMode.STANDARD
         assert ArrayOperationsLogger(LoggingMode.VERBOSE).mode == LoggingMode.VERBOSE
 
+    def test_entries_in_range(self):
+        logger = ArrayOperationsLogger()
+        entries = [make_entry() for _ in range(5)]
+        for i, entry in enumerate(entries):
+            entry.timestamp = 100.0 + i
+            logger.log(entry)
+
+        assert logger.get_entries_in_range(101.0, 103.0) == entries[1:4]
+        assert logger.get_entries_in_range(200.0, 300.0) == []
+
+    def test_entries_in_range_out_of_order(self):
+        logger = ArrayOperationsLogger()
+        late, early = make_entry(), make_entry()
+        late.timestamp, early.timestamp = 105.0, 101.0
+        logger.log(late)
+        logger.log(early)
+
+        assert logger.get_entries_in_range(100.0, 102.0) == [early]
+        assert logger.get_entries_in_range(100.0, 110.0) == [late, early]
+
+    def test_max_entries_evicts_oldest(self):
+        logger = ArrayOperationsLogger(max_entries=2)
+        first = make_entry(operation="exec", success=False)
+        second = make_entry(operation="read")
+        third = make_entry(operation="exec")
+        for entry in (first, second, third):
+            logger.log(entry)
+
+        assert logger.length == 2
+        assert logger.get_entries() == [second, third]
+        assert logger.get_entries_by_operation("exec") == [third]
+        assert logger.get_entries_by_status(False) == []
+
+    @pytest.mark.parametrize("max_entries", [0, -1])
+    def test_max_entries_must_be_positive(self, max_entries):
+        with pytest.raises(ValueError, match="max_entries"):
+            ArrayOperationsLogger(max_entries=max_entries)
+
+    def test_max_entries_one_keeps_latest(self):
+        logger = ArrayOperationsLogger(max_entries=1)
+        logger.log(make_entry(operation="read"))
+        latest = make_entry()
+        logger.log(latest)
+        assert logger.get_entries() == [latest]
+        assert logger.get_entries_by_operation("read") == []
+
+    def test_log_raw_builds_entries_on_retrieval(self):
+        logger = ArrayOperationsLogger()
+        logger.log_raw(100.0, "write", "u", "ws", "/tmp/ws", "f.txt", False, 2.5)
+        logger.log(make_entry(operation="exec"))
+
+        raw = logger.get_entries()[0]
+        assert isinstance(raw, OperationLogEntry)
+        assert (raw.operation, raw.command, raw.success, raw.duration_ms) == (
+            "write",
+            "f.txt",
+            False,
+            2.5,
+        )
+        assert raw.stdout is None and raw.exit_code is None
+        assert logger.get_entries_by_operation("write") == [raw]
+        assert logger.get_entries_by_status(False) == [raw]
+        assert logger.get_entries_in_range(99.0, 101.0) == [raw]
+
+    def test_log_raw_eviction(self):
+        logger = ArrayOperationsLogger(max_entries=1)
+        logger.log_raw(1.0, "write", "u", "ws", "/tmp/ws", "a", True, 1.0)
+        logger.log_raw(2.0, "exec", "u", "ws", "/tmp/ws", "b", True, 1.0)
+        assert [e.command for e in logger.get_entries()] == ["b"]
+        assert logger.get_entries_by_operation("write") == []
+
+    def test_getters_after_clearing_raw_entries(self):
+        logger = ArrayOperationsLogger()
+        logger.log_raw(1.0, "write", "u", "ws", "/tmp/ws", "a", True, 1.0)
+        logger.clear()
+        entry = make_entry()
+        logger.log(entry)
+        assert logger.get_entries()[0] is entry
+        assert logger.get_entries_by_status(True) == [entry]
+
+    def test_clear_resets_indices(self):
+        logger = ArrayOperationsLogger()
+        logger.log(make_entry(operation="read", success=False))
+        logger.clear()
+        assert logger.get_entries_by_operation("read") == []
+        assert logger.get_entries_by_status(False) == []
+
 
 class TestConsoleOperationsLogger:
-    def test_log_success(self, capsys):
+    def test_log_success(self, monkeypatch):
+        stderr = capture_stderr(monkeypatch)
         logger = ConsoleOperationsLogger()
         logger.log(make_entry())
-        captured = capsys.readouterr()
-        assert "\u2713" in captured.err
-        assert "exec" in captured.err
+        out = stderr.getvalue()
+        assert "\u2713" in out
+        assert "exec" in out
 
-    def test_log_failure(self, capsys):
+    def test_log_failure(self, monkeypatch):
+        stderr = capture_stderr(monkeypatch)
         logger = ConsoleOperationsLogger()
         logger.log(make_entry(success=False, error="something broke"))
-        captured = capsys.readouterr()
-        assert "\u2717" in captured.err
-        assert "something broke" in captured.err
+        out = stderr.getvalue()
+        assert "\u2717" in out
+        assert "something broke" in out
 
-    def test_log_exec_stdout(self, capsys):
+    def test_log_exec_stdout(self, monkeypatch):
+        stderr = capture_stderr(monkeypatch)
         logger = ConsoleOperationsLogger()
         logger.log(make_entry(stdout="output text"))
-        captured = capsys.readouterr()
-        assert "stdout: output text" in captured.err
+        assert "stdout: output text" in stderr.getvalue()
+
+    def test_timestamp_matches_isoformat(self):
+        from datetime import UTC, datetime
+
+        logger = ConsoleOperationsLogger()
+        for ts in (0.0, 1700000000.0, 1700000000.25, 1700000000.9999996, time.time()):
+            expected = datetime.fromtimestamp(ts, tz=UTC).isoformat()
+            assert logger._format_timestamp(ts) == expected
+
+    def test_entry_written_in_one_call(self, monkeypatch):
+        writes = []
+
+        class RecordingStream(io.StringIO):
+            def write(self, s):
+                writes.append(s)
+                return len(s)
+
+        monkeypatch.setattr("sys.stderr", RecordingStream())
+        logger = ConsoleOperationsLogger()
+        logger.log(make_entry(success=False, stdout="out", error="boom"))
+        assert len(writes) == 1
+        lines = writes[0].splitlines()
+        assert lines[1:] == ["  stdout: out", "  error: boom"]
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("abc", "abc"),
+            ("a\nb", "a\\nb"),
+            ("abcdef", "abcd..."),
+            ("a\n\nb", "a\\n\\..."),
+            ("\n" * 10_000, "\\n\\n..."),
+        ],
+    )
+    def test_truncate_escapes_newlines(self, text, expected):
+        assert ConsoleOperationsLogger._truncate(text, 4) == expected
 
 
 class TestShouldLogOperation:
@@ -103,3 +253,17 @@ class TestShouldLogOperation:
         assert should_log_operation("read", LoggingMode.VERBOSE)
         assert should_log_operation("exec", LoggingMode.VERBOSE)
         assert should_log_operation("exists", LoggingMode.VERBOSE)
+
+    def test_plain_string_mode_matches_enum(self):
+        assert should_log_operation("read", "verbose")  # type: ignore[arg-type]
+        assert not should_log_operation("read", "standard")  # type: ignore[arg-type]
+
+    def test_verbose_mode_logs_unlisted_operations(self):
+        assert should_log_operation("custom-op", LoggingMode.VERBOSE)  # type: ignore[arg-type]
+        assert not should_log_operation("custom-op", LoggingMode.STANDARD)  # type: ignore[arg-type]
+
+    def test_verbose_mode_covers_every_operation_type(self):
+        from typing import get_args
+
+        for operation in get_args(OperationType):
+            assert should_log_operation(operation, LoggingMode.VERBOSE)
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import weakref
+from types import SimpleNamespace
+
 import pytest
 
-from agent_backend.mcp_integration.client import create_http_transport
+from agent_backend.backends.memory import MemoryBackend
+from agent_backend.mcp_integration.client import create_http_transport, create_mcp_client
 from agent_backend.mcp_integration.transport import (
     _StdioTransportWrapper,
     create_backend_mcp_transport,
@@ -12,28 +17,33 @@ from agent_backend.mcp_integration.transport import (
 from agent_backend.types import BackendError, BackendType
 
 
+def remote_backend(**config) -> SimpleNamespace:
+    """Stand-in remote backend exposing the attributes transport creation reads."""
+    config = {"mcp_server_host_override": None, "auth_token": "tok", **config}
+    return SimpleNamespace(
+        type=BackendType.REMOTE_FILESYSTEM,
+        root_dir="/remote",
+        config=SimpleNamespace(**config),
+    )
+
+
 class TestMCPTransportCreation:
     async def test_unsupported_backend_type(self):
-        class FakeBackend:
-            type = "unsupported"
-
         with pytest.raises(BackendError):
-            await create_backend_mcp_transport(FakeBackend())
+            await create_backend_mcp_transport(SimpleNamespace(type="unsupported"))
 
-    def test_stdio_wrapper_close(self):
+    async def test_stdio_wrapper_close(self):
         wrapper = _StdioTransportWrapper(None)
-        import asyncio
-
-        asyncio.get_event_loop().run_until_complete(wrapper.close())
+        await wrapper.close()
 
     async def test_local_transport_creation(self):
-        class FakeLocalBackend:
-            type = BackendType.LOCAL_FILESYSTEM
-            root_dir = "/workspace"
-            _isolation = "software"
-            _shell = "bash"
-
-        transport = await create_backend_mcp_transport(FakeLocalBackend())
+        backend = SimpleNamespace(
+            type=BackendType.LOCAL_FILESYSTEM,
+            root_dir="/workspace",
+            _isolation="software",
+            _shell="bash",
+        )
+        transport = await create_backend_mcp_transport(backend)
         assert hasattr(transport, "params")
         assert transport.params.command == "agent-backend"
         assert "--rootDir" in transport.params.args
@@ -43,64 +53,39 @@ class TestMCPTransportCreation:
         assert "--shell" in transport.params.args
 
     async def test_local_transport_with_scope(self):
-        class FakeLocalBackend:
-            type = BackendType.LOCAL_FILESYSTEM
-            root_dir = "/workspace"
-            _isolation = None
-            _shell = None
-
-        transport = await create_backend_mcp_transport(FakeLocalBackend(), scope_path="sub")
+        backend = SimpleNamespace(
+            type=BackendType.LOCAL_FILESYSTEM, root_dir="/workspace", _isolation=None, _shell=None
+        )
+        transport = await create_backend_mcp_transport(backend, scope_path="sub")
         assert "/workspace/sub" in transport.params.args
 
     async def test_memory_transport_creation(self):
-        class FakeMemoryBackend:
-            type = BackendType.MEMORY
-            root_dir = "/"
-
-        transport = await create_backend_mcp_transport(FakeMemoryBackend())
+        backend = SimpleNamespace(type=BackendType.MEMORY, root_dir="/")
+        transport = await create_backend_mcp_transport(backend)
         assert hasattr(transport, "params")
         assert "--backend" in transport.params.args
         assert "memory" in transport.params.args
 
     async def test_memory_transport_with_scope(self):
-        class FakeMemoryBackend:
-            type = BackendType.MEMORY
-            root_dir = "/"
-
-        transport = await create_backend_mcp_transport(FakeMemoryBackend(), scope_path="data")
+        backend = SimpleNamespace(type=BackendType.MEMORY, root_dir="/")
+        transport = await create_backend_mcp_transport(backend, scope_path="data")
         assert "//data" in transport.params.args
 
     async def test_remote_transport_creation(self):
-        class FakeRemoteConfig:
-            mcp_server_host_override = None
-            host = "example.com"
-            mcp_port = 3001
-            auth_token = "tok"
-
-        class FakeRemoteBackend:
-            type = BackendType.REMOTE_FILESYSTEM
-            root_dir = "/remote"
-            config = FakeRemoteConfig()
-
-        transport = await create_backend_mcp_transport(FakeRemoteBackend())
+        transport = await create_backend_mcp_transport(
+            remote_backend(host="example.com", mcp_port=3001)
+        )
         assert hasattr(transport, "url")
         assert transport.url == "http://example.com:3001"
         assert transport.auth_token == "tok"
         assert transport.root_dir == "/remote"
 
     async def test_remote_transport_with_mcp_host_override(self):
-        class FakeRemoteConfig:
-            mcp_server_host_override = "override.host"
-            host = "original.host"
-            mcp_port = 4000
-            auth_token = "tok"
-
-        class FakeRemoteBackend:
-            type = BackendType.REMOTE_FILESYSTEM
-            root_dir = "/remote"
-            config = FakeRemoteConfig()
-
-        transport = await create_backend_mcp_transport(FakeRemoteBackend())
+        transport = await create_backend_mcp_transport(
+            remote_backend(
+                host="original.host", mcp_port=4000, mcp_server_host_override="override.host"
+            )
+        )
         assert transport.url == "http://override.host:4000"
 
 
@@ -115,10 +100,40 @@ class TestStdioTransportWrapper:
             def terminate(self):
                 self.terminated = True
 
+            async def wait(self):
+                self.waited = True
+
+        process = FakeProcess()
         wrapper = _StdioTransportWrapper(None)
-        wrapper._process = FakeProcess()
+        wrapper._process = process
         await wrapper.close()
-        assert wrapper._process.terminated
+        assert process.terminated
+        assert process.waited
+        assert wrapper._process is None
+
+    async def test_wrapper_close_kills_unresponsive_process(self, monkeypatch):
+        from agent_backend.mcp_integration import transport
+
+        monkeypatch.setattr(transport, "_CLOSE_TIMEOUT", 0.01)
+
+        class StuckProcess:
+            killed = False
+
+            def terminate(self):
+                pass
+
+            def kill(self):
+                self.killed = True
+
+            async def wait(self):
+                if not self.killed:
+                    await asyncio.sleep(10)
+
+        process = StuckProcess()
+        wrapper = _StdioTransportWrapper(None)
+        wrapper._process = process
+        await wrapper.close()
+        assert process.killed
 
     async def test_wrapper_close_with_failing_process(self):
         class BadProcess:
@@ -131,6 +146,120 @@ class TestStdioTransportWrapper:
         await wrapper.close()
 
 
+class TestMCPClientCache:
+    @pytest.fixture
+    def spawns(self, monkeypatch):
+        from agent_backend.mcp_integration import client
+
+        calls = []
+
+        async def fake_spawn(backend_type, root_dir, isolation, shell, on_closed=None):
+            calls.append((backend_type, root_dir))
+            await asyncio.sleep(0)
+            if root_dir == "/fail":
+                raise RuntimeError("spawn failed")
+            return SimpleNamespace(close_transport=on_closed)
+
+        monkeypatch.setattr(client, "_spawn_mcp_client", fake_spawn)
+        monkeypatch.setattr(client, "_client_cache", weakref.WeakKeyDictionary())
+        return calls
+
+    @pytest.fixture
+    def owner(self):
+        return MemoryBackend()
+
+    async def test_reuses_session_for_same_arguments(self, spawns, owner):
+        first = await create_mcp_client("memory", "/a", owner=owner)
+        second = await create_mcp_client("memory", "/a", owner=owner)
+        other = await create_mcp_client("memory", "/b", owner=owner)
+        assert first is second
+        assert other is not first
+        assert spawns == [("memory", "/a"), ("memory", "/b")]
+
+    async def test_backends_with_same_root_get_separate_sessions(self, spawns):
+        first = await create_mcp_client("memory", "/", owner=MemoryBackend())
+        second = await create_mcp_client("memory", "/", owner=MemoryBackend())
+        assert first is not second
+        assert len(spawns) == 2
+
+    async def test_no_owner_is_not_cached(self, spawns):
+        first = await create_mcp_client("memory", "/a")
+        second = await create_mcp_client("memory", "/a")
+        assert first is not second
+        assert len(spawns) == 2
+
+    async def test_concurrent_callers_share_one_spawn(self, spawns, owner):
+        sessions = await asyncio.gather(
+            *(create_mcp_client("local", "/ws", "software", "bash", owner=owner) for _ in range(5))
+        )
+        assert all(session is sessions[0] for session in sessions)
+        assert len(spawns) == 1
+
+    async def test_failed_spawn_is_not_cached(self, spawns, owner):
+        with pytest.raises(RuntimeError):
+            await create_mcp_client("memory", "/fail", owner=owner)
+        with pytest.raises(RuntimeError):
+            await create_mcp_client("memory", "/fail", owner=owner)
+        assert len(spawns) == 2
+
+    async def test_dead_session_is_replaced(self, spawns, owner):
+        first = await create_mcp_client("memory", "/a", owner=owner)
+        first.close_transport()
+        second = await create_mcp_client("memory", "/a", owner=owner)
+        assert second is not first
+        assert await create_mcp_client("memory", "/a", owner=owner) is second
+        assert len(spawns) == 2
+
+    async def test_cache_released_with_owner(self, spawns):
+        from agent_backend.mcp_integration import client
+
+        owner = MemoryBackend()
+        await create_mcp_client("memory", "/a", owner=owner)
+        assert len(client._client_cache) == 1
+        del owner
+        assert len(client._client_cache) == 0
+
+    async def test_stale_close_does_not_evict_replacement(self, spawns, owner):
+        first = await create_mcp_client("memory", "/a", owner=owner)
+        first.close_transport()
+        second = await create_mcp_client("memory", "/a", owner=owner)
+        first.close_transport()
+        assert await create_mcp_client("memory", "/a", owner=owner) is second
+
+
+class TestWatchedReceiveStream:
+    async def _open_session(self, closed):
+        import anyio
+        from mcp import ClientSession
+
+        from agent_backend.mcp_integration.client import _WatchedReceiveStream
+
+        server_send, client_recv = anyio.create_memory_object_stream(0)
+        client_send, _server_recv = anyio.create_memory_object_stream(0)
+        session = ClientSession(
+            _WatchedReceiveStream(client_recv, lambda: closed.append(True)), client_send
+        )
+        await session.__aenter__()
+        return session, server_send
+
+    async def test_server_eof_reports_closed(self):
+        closed = []
+        session, server_send = await self._open_session(closed)
+        await asyncio.sleep(0.01)
+        assert closed == []
+        await server_send.aclose()
+        await asyncio.sleep(0.01)
+        assert closed == [True]
+        await session.__aexit__(None, None, None)
+        assert closed == [True]
+
+    async def test_session_exit_reports_closed(self):
+        closed = []
+        session, _server_send = await self._open_session(closed)
+        await session.__aexit__(None, None, None)
+        assert closed == [True]
+
+
 class TestHttpTransport:
     def test_create_http_transport(self):
         transport = create_http_transport(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from agent_backend.backends.memory import MemoryBackend
@@ -12,8 +14,11 @@ from agent_backend.types import (
     ErrorCode,
     MemoryBackendConfig,
     NotImplementedBackendError,
+    ReadOptions,
 )
 
+_BUFFER_OPTIONS = ReadOptions(encoding="buffer")
+
 
 class TestMemoryBackendInit:
     def test_default_config(self):
@@ -44,16 +49,12 @@ class TestMemoryBackendRead:
         assert exc_info.value.code == ErrorCode.KEY_NOT_FOUND
 
     async def test_read_bytes(self, memory_backend):
-        from agent_backend.types import ReadOptions
-
-        result = await memory_backend.read("file1.txt", ReadOptions(encoding="buffer"))
+        result = await memory_backend.read("file1.txt", _BUFFER_OPTIONS)
         assert result == b"hello"
 
     async def test_read_bytes_value_as_buffer(self, empty_memory_backend):
-        from agent_backend.types import ReadOptions
-
         await empty_memory_backend.write("bin", b"\x00\x01")
-        result = await empty_memory_backend.read("bin", ReadOptions(encoding="buffer"))
+        result = await empty_memory_backend.read("bin", _BUFFER_OPTIONS)
         assert result == b"\x00\x01"
 
     async def test_read_bytes_value_as_string(self, empty_memory_backend):
@@ -75,12 +76,17 @@ class TestMemoryBackendWrite:
 
     async def test_write_bytes(self, empty_memory_backend):
         await empty_memory_backend.write("binary.bin", b"\x00\x01\x02")
-        from agent_backend.types import ReadOptions
-
-        result = await empty_memory_backend.read("binary.bin", ReadOptions(encoding="buffer"))
+        result = await empty_memory_backend.read("binary.bin", _BUFFER_OPTIONS)
         assert result == b"\x00\x01\x02"
 
 
+    async def test_write_interns_new_keys(self, empty_memory_backend):
+        key = "".join(["dir/", "interned.txt"])
+        await empty_memory_backend.write(key, "x")
+        (stored,) = empty_memory_backend._store
+        assert stored is sys.intern(key)
+
+
 class TestMemoryBackendRename:
     async def test_rename(self, memory_backend):
         await memory_backend.rename("file1.txt", "renamed.txt")
@@ -95,6 +101,12 @@ class TestMemoryBackendRename:
         assert exc_info.value.code == ErrorCode.KEY_NOT_FOUND
 
 
+    async def test_rename_to_same_key(self, memory_backend):
+        await memory_backend.rename("file1.txt", "file1.txt")
+        assert await memory_backend.read("file1.txt") == "hello"
+        assert await memory_backend.list_keys("file1") == ["file1.txt"]
+
+
 class TestMemoryBackendRm:
     async def test_rm_existing(self, memory_backend):
         await memory_backend.rm("file1.txt")
@@ -112,6 +124,12 @@ class TestMemoryBackendRm:
         assert not await memory_backend.exists("dir/nested.txt")
         assert not await memory_backend.exists("dir/deep/file.txt")
 
+    async def test_rm_recursive_keeps_prefix_siblings(self, empty_memory_backend):
+        for key in ("dir", "dir/a", "dir/b/c", "dir-x", "dirx/a"):
+            await empty_memory_backend.write(key, "")
+        await empty_memory_backend.rm("dir", recursive=True)
+        assert await empty_memory_backend.list_keys() == ["dir-x", "dirx/a"]
+
 
 class TestMemoryBackendReaddir:
     async def test_readdir_root(self, memory_backend):
@@ -135,6 +153,19 @@ class TestMemoryBackendReaddir:
         entries = await memory_backend.readdir(".")
         assert "file1.txt" in entries
 
+    async def test_readdir_sibling_names_sharing_prefix(self, empty_memory_backend):
+        for key in ("d/c", "d/c-x", "d/c/y", "d/c/z/w", "d/c0", "dx/other"):
+            await empty_memory_backend.write(key, "")
+        assert await empty_memory_backend.readdir("d") == ["c", "c-x", "c0"]
+        assert await empty_memory_backend.readdir("/") == ["d", "dx"]
+
+    async def test_readdir_tracks_mutations(self, memory_backend):
+        await memory_backend.write("dir/new.txt", "x")
+        await memory_backend.rename("dir/nested.txt", "moved.txt")
+        await memory_backend.rm("dir/deep", recursive=True)
+        assert await memory_backend.readdir("dir") == ["new.txt"]
+        assert await memory_backend.readdir("/") == ["dir", "file1.txt", "file2.txt", "moved.txt"]
+
     async def test_rm_recursive_missing_no_force(self, memory_backend):
         with pytest.raises(BackendError):
             await memory_backend.rm("totally_missing", recursive=True)
@@ -169,6 +200,12 @@ class TestMemoryBackendMisc:
         assert stat.is_directory is False
         assert stat.size == 5  # len("hello")
 
+    async def test_stat_size_is_utf8_length(self, empty_memory_backend):
+        await empty_memory_backend.write("text", "h\u00e9llo")
+        await empty_memory_backend.write("bin", b"\x00\xff")
+        assert (await empty_memory_backend.stat("text")).size == 6
+        assert (await empty_memory_backend.stat("bin")).size == 2
+
     async def test_stat_missing(self, memory_backend):
         with pytest.raises(BackendError):
             await memory_backend.stat("nonexistent")
@@ -197,6 +234,46 @@ class TestMemoryBackendLifecycle:
         await memory_backend.destroy()
         assert len(events) == 0
 
+    async def test_duplicate_subscription_notified_once(self, memory_backend):
+        events = []
+
+        def listener(e):
+            events.append(e)
+
+        memory_backend.on_status_change(listener)
+        memory_backend.on_status_change(listener)
+        await memory_backend.destroy()
+        assert len(events) == 1
+
+    async def test_unsubscribe_during_dispatch(self, memory_backend):
+        events = []
+        unsubs = []
+
+        def first(e):
+            events.append("first")
+            unsubs[1]()
+
+        unsubs.append(memory_backend.on_status_change(first))
+        unsubs.append(memory_backend.on_status_change(lambda e: events.append("second")))
+        await memory_backend.destroy()
+        # Dispatch iterates the snapshot taken before the event
+        assert events == ["first", "second"]
+
+    async def test_status_event_is_immutable(self, memory_backend):
+        events = []
+        memory_backend.on_status_change(events.append)
+        await memory_backend.destroy()
+        with pytest.raises(AttributeError):
+            events[0].to_status = ConnectionStatus.CONNECTED
+
+    async def test_repeated_destroy_emits_one_event(self, memory_backend):
+        events = []
+        memory_backend.on_status_change(lambda e: events.append(e))
+        await memory_backend.destroy()
+        memory_backend.on_status_change(lambda e: events.append(e))
+        await memory_backend.destroy()
+        assert [e.from_status for e in events] == [ConnectionStatus.CONNECTED]
+
     async def test_list_active_scopes(self, memory_backend):
         scopes = await memory_backend.list_active_scopes()
         assert scopes == []
@@ -243,3 +320,9 @@ class TestMemoryBackendHelpers:
     async def test_list_prefix(self, memory_backend):
         keys = await memory_backend.list_keys("dir/")
         assert len(keys) == 2
+
+    async def test_list_prefix_excludes_siblings(self, empty_memory_backend):
+        for key in ("dir", "dir-x", "dir/a", "dir/b/c", "dir0", "dis"):
+            await empty_memory_backend.write(key, "")
+        assert await empty_memory_backend.list_keys("dir/") == ["dir/a", "dir/b/c"]
+        assert await empty_memory_backend.list_keys("dir") == ["dir", "dir-x", "dir/a", "dir/b/c", "dir0"]
@@ -2,64 +2,50 @@
 
 from __future__ import annotations
 
+import os.path
+
 import pytest
 
 from agent_backend.backends.path_validation import (
+    is_trusted_relative,
+    trusted_join_prefix,
     validate_absolute_within_root,
     validate_within_boundary,
+    validate_within_boundary_fast,
 )
 from agent_backend.types import PathEscapeError
 
+_BOUNDARY = "/workspace"
 
-class TestValidateWithinBoundary:
-    def test_relative_path(self):
-        result = validate_within_boundary("file.txt", "/workspace")
-        assert result == "/workspace/file.txt"
-
-    def test_relative_subdir(self):
-        result = validate_within_boundary("subdir/file.txt", "/workspace")
-        assert result == "/workspace/subdir/file.txt"
-
-    def test_dot_path(self):
-        result = validate_within_boundary(".", "/workspace")
-        assert result == "/workspace"
-
-    def test_absolute_matching_boundary(self):
-        result = validate_within_boundary("/workspace/file.txt", "/workspace")
-        assert result == "/workspace/file.txt"
-
-    def test_absolute_matching_boundary_subdir(self):
-        result = validate_within_boundary("/workspace/a/b/c", "/workspace")
-        assert result == "/workspace/a/b/c"
-
-    def test_absolute_not_matching_treated_as_relative(self):
-        result = validate_within_boundary("/file.txt", "/workspace")
-        assert result == "/workspace/file.txt"
-
-    def test_absolute_etc_passwd_treated_as_relative(self):
-        result = validate_within_boundary("/etc/passwd", "/workspace")
-        assert result == "/workspace/etc/passwd"
-
-    def test_escape_via_parent_directory(self):
-        with pytest.raises(PathEscapeError):
-            validate_within_boundary("../etc/passwd", "/workspace")
-
-    def test_escape_via_complex_traversal(self):
-        with pytest.raises(PathEscapeError):
-            validate_within_boundary("a/b/../../../../etc", "/workspace")
 
-    def test_escape_via_root_traversal(self):
+class TestValidateWithinBoundary:
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("file.txt", "/workspace/file.txt"),
+            ("subdir/file.txt", "/workspace/subdir/file.txt"),
+            (".", "/workspace"),
+            # Absolute paths matching the boundary are used directly
+            ("/workspace/file.txt", "/workspace/file.txt"),
+            ("/workspace/a/b/c", "/workspace/a/b/c"),
+            ("/workspace", "/workspace"),
+            # Absolute paths outside the boundary are treated as relative
+            ("/file.txt", "/workspace/file.txt"),
+            ("/etc/passwd", "/workspace/etc/passwd"),
+        ],
+    )
+    def test_resolves_within_boundary(self, path, expected):
+        assert validate_within_boundary(path, _BOUNDARY) == expected
+
+    @pytest.mark.parametrize("path", ["../etc/passwd", "a/b/../../../../etc", "../../.."])
+    def test_escape_raises(self, path):
         with pytest.raises(PathEscapeError):
-            validate_within_boundary("../../..", "/workspace")
+            validate_within_boundary(path, _BOUNDARY)
 
     def test_posix_mode(self):
-        result = validate_within_boundary("file.txt", "/workspace", use_posix=True)
+        result = validate_within_boundary("file.txt", _BOUNDARY, use_posix=True)
         assert result == "/workspace/file.txt"
 
-    def test_boundary_exact_match(self):
-        result = validate_within_boundary("/workspace", "/workspace")
-        assert result == "/workspace"
-
 
 class TestValidateWithinBoundaryPosix:
     """Tests for validate_within_boundary with use_posix=True.
@@ -97,6 +83,84 @@ class TestValidateWithinBoundaryPosix:
             validate_within_boundary("a/b/../../../../etc", "/workspace", use_posix=True)
 
 
+class TestValidateWithinBoundaryCache:
+    def test_repeated_escape_still_raises(self):
+        for _ in range(3):
+            with pytest.raises(PathEscapeError):
+                validate_within_boundary("../cached/escape", "/workspace")
+
+    def test_repeated_valid_path_is_stable(self):
+        first = validate_within_boundary("cached/file.txt", "/workspace")
+        second = validate_within_boundary("cached/file.txt", "/workspace")
+        assert first == second == "/workspace/cached/file.txt"
+
+
+class TestValidateWithinBoundaryFast:
+    def _validate(self, path):
+        return validate_within_boundary_fast(
+            path, "/workspace", "/workspace", "/workspace/", os.path
+        )
+
+    def test_relative_path(self):
+        assert self._validate("sub/file.txt") == "/workspace/sub/file.txt"
+
+    def test_absolute_matching_boundary(self):
+        assert self._validate("/workspace/a/b") == "/workspace/a/b"
+
+    def test_absolute_not_matching_treated_as_relative(self):
+        assert self._validate("/etc/passwd") == "/workspace/etc/passwd"
+
+    def test_escape_rejected(self):
+        with pytest.raises(PathEscapeError):
+            self._validate("../etc/passwd")
+
+
+class TestValidateWithinBoundaryTrustedFastPath:
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "src/main.py",
+            "a/.hidden",
+            "a..b/c",
+            "a/./b",
+            "a//b",
+            "a/b/",
+            "a/.",
+            "./a",
+            ".env",
+            "a/../b",
+        ],
+    )
+    def test_matches_full_resolution(self, path):
+        from agent_backend.backends.path_validation import _validate_cached
+
+        ok, expected = _validate_cached(path, "/workspace", False)
+        assert ok
+        assert validate_within_boundary(path, "/workspace") == expected
+        assert (
+            validate_within_boundary_fast(path, "/workspace", "/workspace", "/workspace/", os.path)
+            == expected
+        )
+
+    def test_relative_boundary_not_fast_pathed(self):
+        assert validate_within_boundary("a/b", "scope") == "scope/a/b"
+
+
+class TestTrustedJoinPrefix:
+    @pytest.mark.parametrize(
+        "boundary", ["scope", "users/alice", "/workspace", "scope/", "./scope", "a/../b", "/ws/"]
+    )
+    def test_join_matches_validation(self, boundary):
+        prefix = trusted_join_prefix(boundary, os.path)
+        for path in ["src/main.py", "a/.hidden", "file.txt"]:
+            assert is_trusted_relative(path, os.path)
+            assert prefix + path == validate_within_boundary(path, boundary)
+
+    @pytest.mark.parametrize("boundary", ["", ".", "/", "./", "a/..", "..", "../a"])
+    def test_root_or_parent_boundary_has_no_prefix(self, boundary):
+        assert trusted_join_prefix(boundary, os.path) is None
+
+
 class TestValidateAbsoluteWithinRoot:
     def test_valid_path(self):
         validate_absolute_within_root("/workspace/file.txt", "/workspace")
@@ -107,3 +171,8 @@ class TestValidateAbsoluteWithinRoot:
     def test_path_outside_root(self):
         with pytest.raises(PathEscapeError):
             validate_absolute_within_root("/etc/passwd", "/workspace")
+
+    def test_rejection_is_repeated_from_cache(self):
+        for _ in range(2):
+            with pytest.raises(PathEscapeError):
+                validate_absolute_within_root("/workspace-other/x", "/workspace")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from agent_backend.backends.memory import MemoryBackend
@@ -13,6 +15,14 @@ def make_backend(**kwargs):
     return MemoryBackend()
 
 
+async def _write_kv(backend):
+    await backend.write("key", "value")
+
+
+async def _raise_value_error(backend):
+    raise ValueError("test")
+
+
 class TestBackendPoolManager:
     @pytest.fixture
     def pool(self):
@@ -40,17 +50,16 @@ class TestBackendPoolManager:
         r2()
 
     async def test_with_backend(self, pool):
-        await pool.with_backend(
-            lambda b: b.write("key", "value"),
-            key="user1",
-        )
+        await pool.with_backend(_write_kv, key="user1")
+
+    async def test_with_backend_sync_callable(self, pool):
+        result = await pool.with_backend(lambda b: b.root_dir, key="user1")
+        assert result == "/"
+        assert pool.get_stats().active_backends == 0
 
     async def test_with_backend_releases_on_error(self, pool):
         with pytest.raises(ValueError):
-            await pool.with_backend(
-                lambda b: (_ for _ in ()).throw(ValueError("test")),
-                key="user1",
-            )
+            await pool.with_backend(_raise_value_error, key="user1")
         stats = pool.get_stats()
         assert stats.active_backends == 0
 
@@ -90,10 +99,41 @@ class TestBackendPoolManager:
         assert b1 is not b2
         r2()
 
+    async def test_acquire_destroys_replaced_idle_backend(self):
+        class FlakyBackend:
+            def __init__(self):
+                self.status = ConnectionStatus.CONNECTED
+                self.destroyed = 0
+
+            async def destroy(self):
+                self.destroyed += 1
+
+        pool = BackendPoolManager(PoolManagerConfig(backend_factory=lambda **kw: FlakyBackend()))
+        b1, r1 = await pool.acquire_backend(key="user1")
+        r1()
+        b1.status = ConnectionStatus.DISCONNECTED
+        b2, r2 = await pool.acquire_backend(key="user1")
+        assert b2 is not b1
+        assert b1.destroyed == 1
+        r2()
+
+    async def test_concurrent_acquires_share_backend(self):
+        created = []
+
+        def factory(**kwargs):
+            created.append(MemoryBackend())
+            return created[-1]
+
+        pool = BackendPoolManager(PoolManagerConfig(backend_factory=factory))
+        results = await asyncio.gather(*(pool.acquire_backend(key="user1") for _ in range(5)))
+        assert len(created) == 1
+        assert {id(backend) for backend, _ in results} == {id(created[0])}
+        assert pool.get_stats().active_backends == 1
+        for _, release in results:
+            release()
+
     async def test_with_backend_no_key(self, pool):
-        await pool.with_backend(
-            lambda b: b.write("key", "value"),
-        )
+        await pool.with_backend(_write_kv)
 
     async def test_config_override(self):
         configs_received = []
@@ -123,6 +163,22 @@ class TestBackendPoolManager:
         r1()
         r2()
 
+    async def test_stats_ignore_replaced_and_destroyed_entries(self, pool):
+        b1, r1 = await pool.acquire_backend(key="user1")
+        await b1.destroy()
+        _, r2 = await pool.acquire_backend(key="user1")
+        _, r3 = await pool.acquire_backend(key="user2")
+        r1()
+        stats = pool.get_stats()
+        assert (stats.total_backends, stats.active_backends, stats.idle_backends) == (2, 2, 0)
+        r2()
+        stats = pool.get_stats()
+        assert (stats.active_backends, stats.idle_backends) == (1, 1)
+        await pool.destroy_all()
+        r3()
+        stats = pool.get_stats()
+        assert (stats.total_backends, stats.active_backends, stats.idle_backends) == (0, 0, 0)
+
     async def test_destroy_all_handles_errors(self):
         class BadBackend:
             status = ConnectionStatus.CONNECTED
@@ -137,11 +193,113 @@ class TestBackendPoolManager:
         # Should not raise
         await pool.destroy_all()
 
+    async def test_destroy_all_runs_concurrently(self):
+        running = 0
+        peak = 0
+
+        class SlowBackend:
+            status = ConnectionStatus.CONNECTED
+
+            async def destroy(self):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0)
+                running -= 1
+
+        pool = BackendPoolManager(PoolManagerConfig(backend_factory=lambda **kw: SlowBackend()))
+        for i in range(40):
+            _, release = await pool.acquire_backend(key=f"k{i}")
+            release()
+        await pool.destroy_all()
+        assert peak == 32
+        assert pool.get_stats().total_backends == 0
+
     async def test_release_without_key_is_noop(self, pool):
         _, release = await pool.acquire_backend()
         release()  # Should be a no-op lambda
 
 
+class TestIdleCleanup:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        from types import SimpleNamespace
+
+        from agent_backend import pool as pool_module
+
+        now = [1000.0]
+        monkeypatch.setattr(
+            pool_module, "time", SimpleNamespace(time=lambda: now[0], monotonic=lambda: now[0])
+        )
+        return now
+
+    @pytest.fixture
+    def pool(self):
+        config = PoolManagerConfig(backend_factory=make_backend, idle_timeout_ms=10_000)
+        return BackendPoolManager(config)
+
+    async def test_expired_backend_destroyed(self, pool, clock):
+        backend, release = await pool.acquire_backend(key="k")
+        release()
+        clock[0] += 11
+        await pool._cleanup_idle_backends()
+        assert pool.get_stats().total_backends == 0
+        assert backend.status == ConnectionStatus.DESTROYED
+
+    async def test_recently_used_backend_kept(self, pool, clock):
+        _, release = await pool.acquire_backend(key="k")
+        release()
+        clock[0] += 8
+        _, release = await pool.acquire_backend(key="k")
+        release()
+        clock[0] += 8
+        await pool._cleanup_idle_backends()
+        assert pool.get_stats().total_backends == 1
+        clock[0] += 3
+        await pool._cleanup_idle_backends()
+        assert pool.get_stats().total_backends == 0
+
+    async def test_in_use_backend_kept(self, pool, clock):
+        _, release = await pool.acquire_backend(key="k")
+        release()
+        _, release_again = await pool.acquire_backend(key="k")
+        clock[0] += 20
+        await pool._cleanup_idle_backends()
+        assert pool.get_stats().active_backends == 1
+        release_again()
+        clock[0] += 11
+        await pool._cleanup_idle_backends()
+        assert pool.get_stats().total_backends == 0
+
+    async def test_wall_clock_jump_does_not_expire(self, pool, monkeypatch):
+        import time
+
+        _, release = await pool.acquire_backend(key="k")
+        release()
+        monkeypatch.setattr(time, "time", lambda: 10**12)
+        await pool._cleanup_idle_backends()
+        assert pool.get_stats().total_backends == 1
+
+    async def test_idle_clock_starts_at_last_release(self, pool, clock):
+        _, r1 = await pool.acquire_backend(key="k")
+        _, r2 = await pool.acquire_backend(key="k")
+        r1()
+        clock[0] += 8
+        r2()
+        clock[0] += 8
+        await pool._cleanup_idle_backends()
+        assert pool.get_stats().total_backends == 1
+        clock[0] += 3
+        await pool._cleanup_idle_backends()
+        assert pool.get_stats().total_backends == 0
+
+    async def test_one_heap_entry_per_idle_backend(self, pool, clock):
+        for _ in range(5):
+            _, release = await pool.acquire_backend(key="k")
+            release()
+        assert len(pool._expiry_heap) == 1
+
+
 class TestPoolStats:
     def test_pool_stats_fields(self):
         stats = PoolStats(
@@ -153,3 +311,9 @@ class TestPoolStats:
         assert stats.total_backends == 3
         assert stats.active_backends == 2
         assert stats.idle_backends == 1
+
+    def test_pool_stats_has_no_instance_dict(self):
+        stats = PoolStats(total_backends=0, active_backends=0, idle_backends=0, backends_by_key={})
+        assert not hasattr(stats, "__dict__")
+        with pytest.raises(AttributeError):
+            stats.total_backends = 1
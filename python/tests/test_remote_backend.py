@@ -57,7 +57,7 @@ class TestRemoteBackendUnit:
         await backend.destroy()
         assert backend.status == ConnectionStatus.DESTROYED
 
-    def test_status_change_callback(self):
+    async def test_status_change_callback(self):
         config = RemoteFilesystemBackendConfig(
             root_dir="/workspace",
             host="localhost",
@@ -66,12 +66,35 @@ class TestRemoteBackendUnit:
         events = []
         backend.on_status_change(lambda e: events.append(e))
         # Manually trigger destroy to test callback
-        import asyncio
-
-        asyncio.get_event_loop().run_until_complete(backend.destroy())
+        await backend.destroy()
         assert len(events) == 1
         assert events[0].to_status == ConnectionStatus.DESTROYED
 
+    def test_config_positional_order(self):
+        from agent_backend.types import IsolationMode, ReconnectionConfig
+
+        reconnection = ReconnectionConfig()
+        config = RemoteFilesystemBackendConfig(
+            "/workspace", "localhost", None, None, 3001, None, None, 30000, 3,
+            reconnection, IsolationMode.NONE, False, 100,
+        )  # fmt: skip
+        assert config.reconnection is reconnection
+        assert (config.isolation, config.prevent_dangerous) == (IsolationMode.NONE, False)
+        assert (config.max_output_length, config.sftp_pool_size) == (100, 1)
+
+    def test_package_import_skips_transport_dependencies(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, agent_backend; "
+            "print(sorted({'asyncssh', 'websockets', 'mcp', 'httpx'} & set(sys.modules)))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "[]"
+
 
 class TestRemoteBackendPathResolution:
     """Unit tests for _resolve_path on RemoteFilesystemBackend."""
@@ -190,3 +213,65 @@ class TestRemoteBackendFileOps:
         cmd = transport.run.call_args[0][0]
         assert cmd.startswith("cd /var/workspace && HOME=/var/workspace ")
         assert "echo hello" in cmd
+
+
+class TestWebSocketSSHTransportSftpPool:
+    def _make_transport(self, pool_size):
+        import asyncio
+
+        from agent_backend.backends.transports.websocket_ssh import WebSocketSSHTransport
+
+        transport = WebSocketSSHTransport("localhost", 3001, sftp_pool_size=pool_size)
+        clients = [MagicMock(name=f"sftp{i}") for i in range(10)]
+        starts = iter(clients)
+
+        async def start_sftp_client():
+            await asyncio.sleep(0)
+            return next(starts)
+
+        conn = MagicMock()
+        conn.start_sftp_client = AsyncMock(side_effect=start_sftp_client)
+        transport._ssh_conn = conn
+        return transport, conn, clients
+
+    async def test_concurrent_callers_start_one_session(self):
+        import asyncio
+
+        transport, conn, clients = self._make_transport(1)
+        results = await asyncio.gather(*(transport.get_sftp() for _ in range(5)))
+        assert conn.start_sftp_client.await_count == 1
+        assert all(r is clients[0] for r in results)
+
+    async def test_pool_round_robins_sessions(self):
+        transport, conn, clients = self._make_transport(2)
+        results = [await transport.get_sftp() for _ in range(4)]
+        assert conn.start_sftp_client.await_count == 2
+        assert results == [clients[0], clients[1], clients[0], clients[1]]
+
+    async def test_close_exits_pooled_sessions(self):
+        transport, _conn, clients = self._make_transport(2)
+        await transport.get_sftp()
+        await transport.get_sftp()
+        transport._ssh_conn = None
+        await transport.close()
+        clients[0].exit.assert_called_once()
+        clients[1].exit.assert_called_once()
+
+
+class TestWebSocketSSHTransportConnect:
+    async def test_connect_disables_compression(self):
+        from unittest.mock import patch
+
+        from agent_backend.backends.transports.websocket_ssh import WebSocketSSHTransport
+
+        transport = WebSocketSSHTransport("localhost", 3001, auth_token="tok")
+        with (
+            patch("websockets.connect", AsyncMock()) as ws_connect,
+            patch("asyncssh.connect", AsyncMock()),
+        ):
+            await transport.connect()
+
+        kwargs = ws_connect.call_args.kwargs
+        assert kwargs["compression"] is None
+        assert kwargs["max_size"] is None
+        assert kwargs["additional_headers"] == {"Authorization": "Bearer tok"}
@@ -34,6 +34,12 @@ class TestScopedMemoryBackend:
         result = await scoped.read("file.txt")
         assert result == "alice data"
 
+    def test_sibling_scopes_share_path_strings(self, scoped_setup):
+        backend, scoped = scoped_setup
+        other = backend.scope("users/" + "alice")
+        assert other.scope_path is scoped.scope_path
+        assert other.root_dir is scoped.root_dir
+
     async def test_write_scoped(self, scoped_setup):
         parent, scoped = scoped_setup
         await scoped.write("new.txt", "new content")
@@ -56,6 +62,24 @@ class TestScopedMemoryBackend:
         with pytest.raises(PathEscapeError):
             await scoped.read("../bob/file.txt")
 
+    async def test_repeated_keys_resolve_consistently(self, scoped_setup):
+        _, scoped = scoped_setup
+        for _ in range(3):
+            assert await scoped.read("file.txt") == "alice data"
+            with pytest.raises(PathEscapeError):
+                await scoped.read("../bob/file.txt")
+
+    async def test_absolute_key_within_scope_root(self, scoped_setup):
+        _, scoped = scoped_setup
+        assert await scoped.read("/users/alice/file.txt") == "alice data"
+        assert await scoped.read("/file.txt") == "alice data"
+
+    async def test_same_key_in_different_scopes(self, scoped_setup):
+        parent, alice = scoped_setup
+        bob = parent.scope("users/bob")
+        assert await alice.read("file.txt") == "alice data"
+        assert await bob.read("file.txt") == "bob data"
+
     async def test_exec_not_implemented(self, scoped_setup):
         _, scoped = scoped_setup
         with pytest.raises(NotImplementedBackendError):
@@ -81,22 +105,6 @@ class TestScopedMemoryBackend:
         scopes = await parent.list_active_scopes()
         assert len(scopes) == 0
 
-    async def test_rename_scoped(self, scoped_setup):
-        _parent, scoped = scoped_setup
-        await scoped.rename("file.txt", "renamed.txt")
-        assert await scoped.exists("renamed.txt")
-        assert not await scoped.exists("file.txt")
-
-    async def test_rm_scoped(self, scoped_setup):
-        _, scoped = scoped_setup
-        await scoped.rm("file.txt")
-        assert not await scoped.exists("file.txt")
-
-    async def test_touch_scoped(self, scoped_setup):
-        _, scoped = scoped_setup
-        await scoped.touch("touched.txt")
-        assert await scoped.exists("touched.txt")
-
     async def test_stat_scoped(self, scoped_setup):
         _, scoped = scoped_setup
         stat = await scoped.stat("file.txt")
@@ -163,6 +171,16 @@ class TestScopedMemoryBackend:
         entries = await scoped.readdir(".")
         assert len(entries) == 0
 
+    async def test_clear_spans_batches(self, scoped_setup):
+        from agent_backend.backends.scoped import _CLEAR_BATCH_SIZE
+
+        parent, scoped = scoped_setup
+        for i in range(_CLEAR_BATCH_SIZE + 5):
+            await scoped.write(f"bulk/{i}.txt", "x")
+        await scoped.clear()
+        assert await scoped.list_keys() == []
+        assert await parent.exists("users/bob/file.txt")
+
     async def test_list_helper(self, scoped_setup):
         _, scoped = scoped_setup
         keys = await scoped.list_keys()
@@ -175,6 +193,42 @@ class TestScopedMemoryBackend:
         assert any("config.json" in k for k in keys)
 
 
+class TestScopedFileOperations:
+    """Behaviour shared by every scoped backend, run once per backend type."""
+
+    @pytest.fixture(params=["empty_memory_backend", "local_backend"], ids=["mem", "local"])
+    def scoped(self, request):
+        return request.getfixturevalue(request.param).scope("scope")
+
+    async def test_readdir(self, scoped):
+        await scoped.write("a.txt", "a")
+        await scoped.write("b.txt", "b")
+        entries = await scoped.readdir(".")
+        assert "a.txt" in entries
+        assert "b.txt" in entries
+
+    async def test_rename(self, scoped):
+        await scoped.write("old.txt", "content")
+        await scoped.rename("old.txt", "new.txt")
+        assert await scoped.exists("new.txt")
+        assert not await scoped.exists("old.txt")
+
+    async def test_rm(self, scoped):
+        await scoped.write("del.txt", "data")
+        await scoped.rm("del.txt")
+        assert not await scoped.exists("del.txt")
+
+    async def test_touch(self, scoped):
+        await scoped.touch("touched.txt")
+        assert await scoped.exists("touched.txt")
+
+    async def test_stat(self, scoped):
+        await scoped.write("s.txt", "hello")
+        stat = await scoped.stat("s.txt")
+        assert stat.is_file
+        assert stat.size == 5
+
+
 class TestScopedFilesystemBackend:
     async def test_scoped_read_write(self, local_backend, tmp_workspace):
         import os
@@ -192,6 +246,25 @@ class TestScopedFilesystemBackend:
         with pytest.raises(PathEscapeError):
             await scoped.read("../../etc/passwd")
 
+    async def test_scoped_absolute_path_within_scope_root(self, local_backend, tmp_workspace):
+        scoped = local_backend.scope("scope")
+        await scoped.write("file.txt", "data")
+        assert await scoped.read(f"{tmp_workspace}/scope/file.txt") == "data"
+        assert await scoped.read("/file.txt") == "data"
+
+    async def test_ensure_root_skipped_once_ensured(self, local_backend):
+        scoped = local_backend.scope("scope")
+        await scoped.write("a.txt", "a")
+        assert scoped._root_ensured
+
+        async def fail():
+            raise AssertionError("_ensure_root called after root was ensured")
+
+        scoped._ensure_root = fail
+        await scoped.write("b.txt", "b")
+        await scoped.mkdir("sub")
+        assert await scoped.readdir(".") == ["a.txt", "b.txt", "sub"]
+
     async def test_scoped_exec(self, local_backend):
         scoped = local_backend.scope("scope")
         result = await scoped.exec("echo hello")
@@ -252,44 +325,11 @@ class TestScopedFilesystemBackend:
         scoped.track_closeable(closeable)
         assert closeable in local_backend._closeables
 
-    async def test_readdir_scoped(self, local_backend):
-        scoped = local_backend.scope("scope")
-        await scoped.write("a.txt", "a")
-        await scoped.write("b.txt", "b")
-        entries = await scoped.readdir(".")
-        assert "a.txt" in entries
-        assert "b.txt" in entries
-
-    async def test_rename_scoped(self, local_backend):
-        scoped = local_backend.scope("scope")
-        await scoped.write("old.txt", "content")
-        await scoped.rename("old.txt", "new.txt")
-        assert await scoped.exists("new.txt")
-        assert not await scoped.exists("old.txt")
-
-    async def test_rm_scoped(self, local_backend):
-        scoped = local_backend.scope("scope")
-        await scoped.write("del.txt", "data")
-        await scoped.rm("del.txt")
-        assert not await scoped.exists("del.txt")
-
     async def test_mkdir_scoped(self, local_backend):
         scoped = local_backend.scope("scope")
         await scoped.mkdir("sub/dir")
         assert await scoped.exists("sub/dir")
 
-    async def test_touch_scoped(self, local_backend):
-        scoped = local_backend.scope("scope")
-        await scoped.touch("touched.txt")
-        assert await scoped.exists("touched.txt")
-
-    async def test_stat_scoped(self, local_backend):
-        scoped = local_backend.scope("scope")
-        await scoped.write("s.txt", "hello")
-        stat = await scoped.stat("s.txt")
-        assert stat.is_file
-        assert stat.size == 5
-
     async def test_list_active_scopes(self, local_backend):
         scoped = local_backend.scope("scope")
         scopes = await scoped.list_active_scopes()
@@ -307,3 +347,34 @@ class TestScopedFilesystemBackend:
         scoped = local_backend.scope("scope", config)
         result = await scoped.exec("echo $FOO")
         assert result == "bar"
+
+    def test_merge_env_skips_copy_for_one_sided_env(self, local_backend):
+        from agent_backend.types import ScopeConfig
+
+        plain = local_backend.scope("plain")
+        command_env = {"A": "1"}
+        assert plain._merge_env(None) is None
+        assert plain._merge_env(command_env) is command_env
+
+        scoped = local_backend.scope("scope", ScopeConfig(env={"FOO": "bar"}))
+        assert scoped._merge_env(None) is scoped._merge_env({})
+        assert scoped._merge_env({"FOO": "baz", "A": "1"}) == {"FOO": "baz", "A": "1"}
+        with pytest.raises(TypeError):
+            scoped._merge_env(None)["FOO"] = "changed"
+
+
+class TestFastJoin:
+    def test_matches_posixpath_join(self):
+        import posixpath
+
+        from agent_backend.backends.scoped import _fast_join
+
+        for base, path in [
+            ("users/alice", "project"),
+            ("users/alice/", "project"),
+            ("", "project"),
+            ("users", ""),
+            ("users", "/abs"),
+            ("users/", "a/b"),
+        ]:
+            assert _fast_join(base, path) == posixpath.join(base, path)
@@ -3,30 +3,39 @@
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
 from agent_backend.adapters.vercel import VercelAIAdapter
 
 
+class _FakeBackend:
+    """Just the backend surface the adapter touches."""
+
+    def __init__(self, transport=None):
+        self._transport = transport
+        self.tracked = []
+
+    async def get_mcp_transport(self):
+        return self._transport
+
+    def track_closeable(self, closeable):
+        self.tracked.append(closeable)
+
+
 class TestVercelAIAdapter:
     def test_init_defaults(self):
-        backend = AsyncMock()
-        adapter = VercelAIAdapter(backend)
+        adapter = VercelAIAdapter(_FakeBackend())
         assert adapter._connection_timeout_ms == 15000
 
     def test_init_custom_timeout(self):
-        backend = AsyncMock()
-        adapter = VercelAIAdapter(backend, connection_timeout_ms=5000)
+        adapter = VercelAIAdapter(_FakeBackend(), connection_timeout_ms=5000)
         assert adapter._connection_timeout_ms == 5000
 
     async def test_get_mcp_client_timeout(self):
         """Test that timeout is properly raised."""
-        backend = AsyncMock()
-        backend.get_mcp_transport = AsyncMock(return_value=None)
-
-        adapter = VercelAIAdapter(backend, connection_timeout_ms=50)
+        adapter = VercelAIAdapter(_FakeBackend(), connection_timeout_ms=50)
 
         # Patch _create_client to sleep forever
         async def slow_create(transport):
@@ -38,19 +47,14 @@ class TestVercelAIAdapter:
 
     async def test_get_mcp_client_unsupported_transport(self):
         """Test ValueError for unsupported transport type."""
-        backend = AsyncMock()
-        backend.get_mcp_transport = AsyncMock(return_value="not-a-real-transport")
-
-        adapter = VercelAIAdapter(backend)
+        adapter = VercelAIAdapter(_FakeBackend(transport="not-a-real-transport"))
         with pytest.raises(ValueError, match="Unsupported transport type"):
             await adapter.get_mcp_client()
 
     async def test_get_mcp_client_tracks_closeable(self):
         """Test that client is tracked as closeable on success."""
-        backend = AsyncMock()
-        backend.get_mcp_transport = AsyncMock(return_value=None)
-
-        fake_client = AsyncMock()
+        backend = _FakeBackend()
+        fake_client = object()
         adapter = VercelAIAdapter(backend)
 
         async def fake_create(transport):
@@ -60,4 +64,4 @@ class TestVercelAIAdapter:
             client = await adapter.get_mcp_client()
 
         assert client is fake_client
-        backend.track_closeable.assert_called_once_with(fake_client)
+        assert backend.tracked == [fake_client]